@@ -9,180 +9,176 @@ This demo illustrates how different confidence thresholds apply to different cat
 - Internal: 0.60 threshold (low risk)
 """
 
+import logging
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+
 from backend.enhanced_decision_engine import EnhancedDecisionEngine
 
-def run_threshold_demo():
-    """Demonstrate the threshold system with various test cases"""
-    
-    print("🎯 ENHANCED THRESHOLD SYSTEM DEMO")
-    print("=" * 60)
-    print("Different categories have different confidence thresholds:")
-    print("• Legal/Compliance: 0.90 (super strict)")
-    print("• Safety/Health: 0.85 (strict)")
-    print("• Business/Analytics: 0.70 (moderate)")
-    print("• Internal: 0.60 (low risk)")
-    print()
-    
-    engine = EnhancedDecisionEngine()
-    
-    # Test Case 1: High-risk Legal Compliance (GDPR)
-    print("🧪 TEST CASE 1: GDPR Compliance (High Risk)")
-    print("-" * 40)
-    
-    llm_output = {
-        "flag": "NeedsGeoLogic",
-        "confidence": 0.88,  # Below 0.90 threshold
-        "reasoning": "GDPR compliance required for EU users under 16",
-        "suggested_jurisdictions": ["European Union"],
-        "evidence_passage_ids": ["EV1", "EV2"]
-    }
-    
-    result = engine.make_decision(
+@lru_cache(maxsize=1)
+def _engine() -> EnhancedDecisionEngine:
+    """Shared engine, so its threshold config is loaded once per process"""
+    return EnhancedDecisionEngine()
+
+@lru_cache(maxsize=1)
+def _summary() -> dict:
+    """Threshold summary of the shared engine; the config doesn't change at runtime"""
+    return _engine().get_threshold_summary()
+
+@lru_cache(maxsize=None)
+def _display_name(category: str) -> str:
+    """Display form of a snake_case category name, e.g. 'legal_compliance' -> 'Legal Compliance'"""
+    return category.replace('_', ' ').title()
+
+@dataclass(frozen=True, slots=True)
+class DemoCase:
+    """One demo feature together with its simulated LLM output"""
+    heading: str
+    label: str
+    feature_text: str
+    llm_output: dict
+    rules_matched: tuple = ()
+
+# Built once at import time so repeated runs don't rebuild the case literals
+_CASES = (
+    DemoCase(
+        heading="🧪 TEST CASE 1: GDPR Compliance (High Risk)",
+        label="GDPR age verification for EU minors",
         feature_text="Implement age verification for EU users under 16 to comply with GDPR Article 8",
-        llm_output=llm_output,
-        rules_matched=[],
-        rule_fired=False
-    )
-    
-    print(f"Feature: GDPR age verification for EU minors")
-    print(f"LLM Confidence: {llm_output['confidence']:.2f}")
-    print(f"Categories Detected: {result.categories_detected}")
-    print(f"Applicable Threshold: {engine.get_applicable_threshold(result.categories_detected)[0]:.2f}")
-    print(f"Final Flag: {result.final_flag}")
-    print(f"Review Required: {result.review_required}")
-    print(f"Escalation Reason: {result.escalation_reason}")
-    print(f"Review Priority: {result.review_priority}")
-    print()
-    
-    # Test Case 2: Moderate Risk Safety (Child Protection)
-    print("🧪 TEST CASE 2: Child Protection (Moderate Risk)")
-    print("-" * 40)
-    
-    llm_output2 = {
-        "flag": "NeedsGeoLogic",
-        "confidence": 0.82,  # Below 0.85 threshold
-        "reasoning": "Child protection features may require geo-logic",
-        "suggested_jurisdictions": ["United States"],
-        "evidence_passage_ids": ["EV2"]
-    }
-    
-    result2 = engine.make_decision(
+        llm_output={
+            "flag": "NeedsGeoLogic",
+            "confidence": 0.88,  # Below 0.90 threshold
+            "reasoning": "GDPR compliance required for EU users under 16",
+            "suggested_jurisdictions": ["European Union"],
+            "evidence_passage_ids": ["EV1", "EV2"]
+        }
+    ),
+    DemoCase(
+        heading="🧪 TEST CASE 2: Child Protection (Moderate Risk)",
+        label="Parental controls for US minors",
         feature_text="Add parental controls for users under 13 in US markets",
-        llm_output=llm_output2,
-        rules_matched=["child_protection"],
-        rule_fired=False
-    )
-    
-    print(f"Feature: Parental controls for US minors")
-    print(f"LLM Confidence: {llm_output2['confidence']:.2f}")
-    print(f"Categories Detected: {result2.categories_detected}")
-    print(f"Applicable Threshold: {engine.get_applicable_threshold(result2.categories_detected)[0]:.2f}")
-    print(f"Final Flag: {result2.final_flag}")
-    print(f"Review Required: {result2.review_required}")
-    print(f"Escalation Reason: {result2.escalation_reason}")
-    print(f"Review Priority: {result2.review_priority}")
-    print()
-    
-    # Test Case 3: Low Risk Business Analytics
-    print("🧪 TEST CASE 3: Business Analytics (Low Risk)")
-    print("-" * 40)
-    
-    llm_output3 = {
-        "flag": "NoGeoLogic",
-        "confidence": 0.75,  # Above 0.70 threshold
-        "reasoning": "A/B testing for user engagement optimization",
-        "suggested_jurisdictions": [],
-        "evidence_passage_ids": []
-    }
-    
-    result3 = engine.make_decision(
+        llm_output={
+            "flag": "NeedsGeoLogic",
+            "confidence": 0.82,  # Below 0.85 threshold
+            "reasoning": "Child protection features may require geo-logic",
+            "suggested_jurisdictions": ["United States"],
+            "evidence_passage_ids": ["EV2"]
+        },
+        rules_matched=("child_protection",)
+    ),
+    DemoCase(
+        heading="🧪 TEST CASE 3: Business Analytics (Low Risk)",
+        label="A/B test UI design in Canada",
         feature_text="A/B test new UI design in Canada for user engagement optimization",
-        llm_output=llm_output3,
-        rules_matched=[],
-        rule_fired=False
-    )
-    
-    print(f"Feature: A/B test UI design in Canada")
-    print(f"LLM Confidence: {llm_output3['confidence']:.2f}")
-    print(f"Categories Detected: {result3.categories_detected}")
-    print(f"Applicable Threshold: {engine.get_applicable_threshold(result3.categories_detected)[0]:.2f}")
-    print(f"Final Flag: {result3.final_flag}")
-    print(f"Review Required: {result3.review_required}")
-    print(f"Escalation Reason: {result3.escalation_reason}")
-    print(f"Review Priority: {result3.review_priority}")
-    print()
-    
-    # Test Case 4: Very Low Risk Internal Feature
-    print("🧪 TEST CASE 4: Internal Feature (Very Low Risk)")
-    print("-" * 40)
-    
-    llm_output4 = {
-        "flag": "NoGeoLogic",
-        "confidence": 0.65,  # Above 0.60 threshold
-        "reasoning": "Performance optimization for internal use",
-        "suggested_jurisdictions": [],
-        "evidence_passage_ids": []
-    }
-    
-    result4 = engine.make_decision(
+        llm_output={
+            "flag": "NoGeoLogic",
+            "confidence": 0.75,  # Above 0.70 threshold
+            "reasoning": "A/B testing for user engagement optimization",
+            "suggested_jurisdictions": [],
+            "evidence_passage_ids": []
+        }
+    ),
+    DemoCase(
+        heading="🧪 TEST CASE 4: Internal Feature (Very Low Risk)",
+        label="Performance optimization for analytics",
         feature_text="Optimize thumbnail caching performance for internal analytics",
-        llm_output=llm_output4,
-        rules_matched=[],
-        rule_fired=False
-    )
-    
-    print(f"Feature: Performance optimization for analytics")
-    print(f"LLM Confidence: {llm_output4['confidence']:.2f}")
-    print(f"Categories Detected: {result4.categories_detected}")
-    print(f"Applicable Threshold: {engine.get_applicable_threshold(result4.categories_detected)[0]:.2f}")
-    print(f"Final Flag: {result4.final_flag}")
-    print(f"Review Required: {result4.review_required}")
-    print(f"Escalation Reason: {result4.escalation_reason}")
-    print(f"Review Priority: {result4.review_priority}")
-    print()
-    
-    # Test Case 5: Hybrid Case (Multiple Categories)
-    print("🧪 TEST CASE 5: Hybrid Case (Multiple Categories)")
-    print("-" * 40)
-    
-    llm_output5 = {
-        "flag": "NeedsGeoLogic",
-        "confidence": 0.86,  # Below 0.88 threshold (strictest of multiple categories)
-        "reasoning": "Combines child protection with data residency requirements",
-        "suggested_jurisdictions": ["European Union"],
-        "evidence_passage_ids": ["EV1", "EV4"]
-    }
-    
-    result5 = engine.make_decision(
+        llm_output={
+            "flag": "NoGeoLogic",
+            "confidence": 0.65,  # Above 0.60 threshold
+            "reasoning": "Performance optimization for internal use",
+            "suggested_jurisdictions": [],
+            "evidence_passage_ids": []
+        }
+    ),
+    DemoCase(
+        heading="🧪 TEST CASE 5: Hybrid Case (Multiple Categories)",
+        label="EU minor data storage + parental controls",
         feature_text="Store EU minor user data locally with enhanced parental controls",
-        llm_output=llm_output5,
-        rules_matched=["child_protection", "data_residency"],
-        rule_fired=False
-    )
+        llm_output={
+            "flag": "NeedsGeoLogic",
+            "confidence": 0.86,  # Below 0.88 threshold (strictest of multiple categories)
+            "reasoning": "Combines child protection with data residency requirements",
+            "suggested_jurisdictions": ["European Union"],
+            "evidence_passage_ids": ["EV1", "EV4"]
+        },
+        rules_matched=("child_protection", "data_residency")
+    ),
+)
+
+# Per-case detail goes through logging so quiet runs (LOGEO_QUIET=1, or pytest
+# without log capture at INFO) skip formatting it altogether
+log = logging.getLogger("logeo.demo")
+
+# Scored once before timing so first-call setup isn't counted as decision time
+_WARMUP_JOB = (
+    "warmup",
+    {"flag": "NoGeoLogic", "confidence": 0.5, "reasoning": "", "suggested_jurisdictions": [], "evidence_passage_ids": []},
+    [],
+    False
+)
+
+def run_threshold_demo():
+    """Demonstrate the threshold system with various test cases"""
     
-    print(f"Feature: EU minor data storage + parental controls")
-    print(f"LLM Confidence: {llm_output5['confidence']:.2f}")
-    print(f"Categories Detected: {result5.categories_detected}")
-    print(f"Applicable Threshold: {engine.get_applicable_threshold(result5.categories_detected)[0]:.2f}")
-    print(f"Final Flag: {result5.final_flag}")
-    print(f"Review Required: {result5.review_required}")
-    print(f"Escalation Reason: {result5.escalation_reason}")
-    print(f"Review Priority: {result5.review_priority}")
-    print()
+    # Each section is assembled and written with a single sys.stdout.write
+    sys.stdout.write("\n".join([
+        "🎯 ENHANCED THRESHOLD SYSTEM DEMO",
+        "=" * 60,
+        "Different categories have different confidence thresholds:",
+        "• Legal/Compliance: 0.90 (super strict)",
+        "• Safety/Health: 0.85 (strict)",
+        "• Business/Analytics: 0.70 (moderate)",
+        "• Internal: 0.60 (low risk)",
+        ""
+    ]) + "\n")
+    
+    engine = _engine()
+    # Inputs are built up front and the engine methods hoisted out of the loop
+    md = engine.make_decision
+    gat = engine.get_applicable_threshold
+    jobs = [(case.feature_text, case.llm_output, list(case.rules_matched), False) for case in _CASES]
+    
+    md(*_WARMUP_JOB)
+    t0 = time.perf_counter()
+    results = [md(*job) for job in jobs]
+    per_decision = (time.perf_counter() - t0) / len(jobs)
+    
+    if log.isEnabledFor(logging.INFO):
+        for case, result in zip(_CASES, results):
+            threshold, _ = gat(result.categories_detected)
+            log.info(
+                "%s\n%s\nFeature: %s\nLLM Confidence: %.2f\nCategories Detected: %s\n"
+                "Applicable Threshold: %.2f\nFinal Flag: %s\nReview Required: %s\n"
+                "Escalation Reason: %s\nReview Priority: %s\n",
+                case.heading, "-" * 40, case.label, case.llm_output["confidence"],
+                result.categories_detected, threshold, result.final_flag,
+                result.review_required, result.escalation_reason, result.review_priority
+            )
     
     # Summary
-    print("📊 THRESHOLD SYSTEM SUMMARY")
-    print("=" * 60)
-    print("The system automatically:")
-    print("1. Detects applicable categories for each feature")
-    print("2. Applies the strictest threshold when multiple categories apply")
-    print("3. Flags for human review when confidence is below threshold")
-    print("4. Provides escalation rules based on risk level")
-    print()
-    
-    threshold_summary = engine.get_threshold_summary()
-    for category, config in threshold_summary.items():
-        print(f"• {category.replace('_', ' ').title()}: {config['threshold']:.2f} → {config['escalation']}")
+    sys.stdout.write("\n".join([
+        f"⏱️  Average decision time: {per_decision * 1e6:.1f} µs over {len(jobs)} cases",
+        "",
+        "📊 THRESHOLD SYSTEM SUMMARY",
+        "=" * 60,
+        "The system automatically:",
+        "1. Detects applicable categories for each feature",
+        "2. Applies the strictest threshold when multiple categories apply",
+        "3. Flags for human review when confidence is below threshold",
+        "4. Provides escalation rules based on risk level",
+        "",
+        *(f"• {_display_name(category)}: {config['threshold']:.2f} → {config['escalation']}"
+          for category, config in _summary().items())
+    ]) + "\n")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        # LOGEO_QUIET=1/true/yes hides the per-case detail; unset or 0 shows it
+        level=logging.WARNING if os.getenv("LOGEO_QUIET", "").lower() in ("1", "true", "yes") else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
     run_threshold_demo() 
\ No newline at end of file
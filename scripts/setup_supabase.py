@@ -10,6 +10,9 @@ Required tables:
 - access_logs: Log all access attempts for audit trail  
 - classification_results: Store all feature classification data
 
+Required functions:
+- classification_stats(): Aggregate classification statistics server-side
+
 Usage:
     python scripts/setup_supabase.py
 """
@@ -33,15 +36,88 @@ CREATE TABLE IF NOT EXISTS geo_rules (
     updated_at TIMESTAMP DEFAULT NOW()
 );
 
--- Create access_logs table
+-- Create access_logs table, range-partitioned by month so inserts and
+-- recent-log reads only touch the newest partition and old months are
+-- dropped instead of vacuumed. (An existing unpartitioned access_logs has to
+-- be renamed and its rows copied into this table.)
 CREATE TABLE IF NOT EXISTS access_logs (
-    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    id UUID DEFAULT gen_random_uuid(),
     user_id TEXT NOT NULL,
     feature_name TEXT NOT NULL,
     country TEXT NOT NULL,
     access_granted BOOLEAN NOT NULL,
-    timestamp TIMESTAMP DEFAULT NOW()
-);
+    timestamp TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (id, timestamp)
+) PARTITION BY RANGE (timestamp);
+
+-- Catch-all so inserts never fail if partition maintenance falls behind;
+-- the maintenance function moves such rows into their month's partition
+CREATE TABLE IF NOT EXISTS access_logs_default PARTITION OF access_logs DEFAULT;
+
+-- Create partitions up to months_ahead months out; detach and drop expired ones.
+-- The DROP replaces the older one-argument signature, which would otherwise
+-- be left as an ambiguous overload
+DROP FUNCTION IF EXISTS maintain_access_logs_partitions(INT);
+CREATE OR REPLACE FUNCTION maintain_access_logs_partitions(
+    retention_months INT DEFAULT 12,
+    months_ahead INT DEFAULT 3
+)
+RETURNS void
+LANGUAGE plpgsql AS $$
+DECLARE
+    month_start DATE;
+    partition_name TEXT;
+    expired RECORD;
+BEGIN
+    FOR month_offset IN 0..months_ahead LOOP
+        month_start := date_trunc('month', NOW()) + make_interval(months => month_offset);
+        partition_name := 'access_logs_' || to_char(month_start, 'YYYY_MM');
+        CONTINUE WHEN to_regclass(partition_name) IS NOT NULL;
+
+        -- Rows for this month that landed in the default partition would make
+        -- CREATE ... PARTITION OF fail, so the default is detached while they
+        -- are moved into the new partition, then attached again
+        ALTER TABLE access_logs DETACH PARTITION access_logs_default;
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF access_logs FOR VALUES FROM (%L) TO (%L)',
+            partition_name,
+            month_start,
+            month_start + INTERVAL '1 month'
+        );
+        EXECUTE format(
+            'WITH moved AS ('
+            '    DELETE FROM access_logs_default WHERE timestamp >= %L AND timestamp < %L RETURNING *'
+            ') INSERT INTO %I SELECT * FROM moved',
+            month_start,
+            month_start + INTERVAL '1 month',
+            partition_name
+        );
+        ALTER TABLE access_logs ATTACH PARTITION access_logs_default DEFAULT;
+    END LOOP;
+
+    FOR expired IN
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = 'access_logs'::regclass
+          AND child.relname ~ '^access_logs_[0-9]{4}_[0-9]{2}$'
+          AND to_date(right(child.relname, 7), 'YYYY_MM')
+              < date_trunc('month', NOW()) - make_interval(months => retention_months)
+    LOOP
+        EXECUTE format('ALTER TABLE access_logs DETACH PARTITION %I', expired.relname);
+        EXECUTE format('DROP TABLE %I', expired.relname);
+    END LOOP;
+END;
+$$;
+
+SELECT maintain_access_logs_partitions();
+
+-- Required: run partition maintenance daily with pg_cron (also available
+-- under Database -> Extensions in the dashboard). Without it, new months
+-- fall into access_logs_default and old months are never dropped.
+-- Re-running cron.schedule with the same job name replaces the job
+CREATE EXTENSION IF NOT EXISTS pg_cron;
+SELECT cron.schedule('access-logs-partitions', '0 3 * * *', 'SELECT maintain_access_logs_partitions()');
 
 -- Create classification_results table for storing all classification data
 CREATE TABLE IF NOT EXISTS classification_results (
@@ -54,9 +130,13 @@ CREATE TABLE IF NOT EXISTS classification_results (
     regulations TEXT[] DEFAULT '{}',
     risk_level TEXT NOT NULL,
     specific_requirements TEXT[] DEFAULT '{}',
-    timestamp TIMESTAMP DEFAULT NOW()
+    timestamp TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Existing deployments: let Postgres stamp log rows instead of the client
+ALTER TABLE access_logs ALTER COLUMN timestamp SET DEFAULT NOW();
+ALTER TABLE classification_results ALTER COLUMN timestamp SET DEFAULT NOW();
+
 -- Insert sample geo-compliance rules
 INSERT INTO geo_rules (feature_name, allowed_countries, blocked_countries) VALUES
 ('user_registration', '{"US","CA","UK","AU","EU"}', '{"CN","RU","KP"}'),
@@ -68,12 +148,45 @@ INSERT INTO geo_rules (feature_name, allowed_countries, blocked_countries) VALUE
 ON CONFLICT (feature_name) DO NOTHING;
 
 -- Create indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_access_logs_timestamp ON access_logs(timestamp DESC);
+-- Keyset pages walk (timestamp DESC, id DESC); replaces the older id ASC index
+DROP INDEX IF EXISTS idx_access_logs_timestamp;
+CREATE INDEX IF NOT EXISTS idx_access_logs_page ON access_logs(timestamp DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_access_logs_user_id ON access_logs(user_id);
 CREATE INDEX IF NOT EXISTS idx_access_logs_feature ON access_logs(feature_name);
-CREATE INDEX IF NOT EXISTS idx_classification_results_timestamp ON classification_results(timestamp DESC);
+DROP INDEX IF EXISTS idx_classification_results_timestamp;
+CREATE INDEX IF NOT EXISTS idx_classification_results_page ON classification_results(timestamp DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_classification_results_risk_level ON classification_results(risk_level);
 CREATE INDEX IF NOT EXISTS idx_classification_results_needs_geo_logic ON classification_results(needs_geo_logic);
+CREATE INDEX IF NOT EXISTS idx_classification_results_risk_geo ON classification_results(risk_level, needs_geo_logic);
+
+-- Aggregate classification statistics server-side (called via rpc("classification_stats")).
+-- Confidence comes back as sum and count, not an average, so the client can
+-- keep folding new rows into it exactly; the DROP replaces the older avg_conf
+-- signature, which CREATE OR REPLACE cannot change
+DROP FUNCTION IF EXISTS classification_stats();
+CREATE FUNCTION classification_stats()
+RETURNS TABLE (
+    total BIGINT,
+    compliance_required BIGINT,
+    no_compliance BIGINT,
+    sum_conf DOUBLE PRECISION,
+    count_conf BIGINT,
+    low BIGINT,
+    medium BIGINT,
+    high BIGINT
+)
+LANGUAGE sql STABLE AS $$
+    SELECT
+        count(*),
+        count(*) FILTER (WHERE needs_geo_logic),
+        count(*) FILTER (WHERE NOT needs_geo_logic),
+        coalesce(sum(confidence), 0),
+        count(confidence),
+        count(*) FILTER (WHERE lower(risk_level) = 'low'),
+        count(*) FILTER (WHERE lower(risk_level) = 'medium'),
+        count(*) FILTER (WHERE lower(risk_level) = 'high')
+    FROM classification_results;
+$$;
     """)
     
     print("=" * 60)
@@ -83,6 +196,8 @@ CREATE INDEX IF NOT EXISTS idx_classification_results_needs_geo_logic ON classif
     print("3. Copy and paste the SQL commands above")
     print("4. Click 'RUN' to execute")
     print("5. Verify tables are created in the Table Editor")
+    print("6. Check the access-logs-partitions job is listed in cron.job (partition")
+    print("   maintenance must run daily; the pg_cron extension is required)")
     print("\n🎯 After setup, your system will store:")
     print("• All classification results in Supabase") 
     print("• Geographic access logs")
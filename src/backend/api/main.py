@@ -66,6 +66,9 @@ class EnhancedComplianceResult(BaseModel):
     method_used: str
     processing_time_ms: float
 
+class FeatureBatch(BaseModel):
+    items: List[FeatureArtifact]
+
 class BatchResult(BaseModel):
     total_processed: int
     results: List[dict]
@@ -139,6 +142,19 @@ def classify_feature_enhanced(title: str, description: str) -> EnhancedComplianc
         processing_time_ms=result.processing_time_ms
     )
 
+def to_legacy_result(result: EnhancedComplianceResult) -> ComplianceResult:
+    """Legacy-format view of an enhanced result, as logged for the audit trail"""
+    return ComplianceResult(
+        needs_geo_logic=result.needs_geo_logic,
+        confidence=result.overall_confidence,
+        reasoning=result.reasoning,
+        applicable_regulations=result.applicable_regulations,
+        risk_assessment=result.risk_assessment,
+        regulatory_requirements=result.regulatory_requirements,
+        evidence_sources=result.evidence_sources,
+        recommended_actions=result.recommended_actions
+    )
+
 def classify_feature(title: str, description: str) -> ComplianceResult:
     """
     Analyze feature artifacts to determine if geo-specific compliance logic is required.
@@ -210,6 +226,11 @@ async def log_result(title: str, description: str, result: ComplianceResult):
         print(f"Warning: Failed to log result: {e}")
         # Continue execution even if logging fails
 
+@app.on_event("shutdown")
+async def shutdown_supabase():
+    """Flush buffered Supabase log rows before the process exits"""
+    await get_supabase_client().aclose()
+
 @app.get("/")
 async def root():
     return {"message": "Geo-Compliance Detection API", "version": "1.0.0"}
@@ -258,22 +279,33 @@ async def classify_single_feature_enhanced(
         result = classify_feature_enhanced(feature.title, feature.description)
         
         # Log enhanced result for audit trail (convert to legacy format for compatibility)
-        legacy_result = ComplianceResult(
-            needs_geo_logic=result.needs_geo_logic,
-            confidence=result.overall_confidence,
-            reasoning=result.reasoning,
-            applicable_regulations=result.applicable_regulations,
-            risk_assessment=result.risk_assessment,
-            regulatory_requirements=result.regulatory_requirements,
-            evidence_sources=result.evidence_sources,
-            recommended_actions=result.recommended_actions
-        )
-        await log_result(feature.title, feature.description, legacy_result)
+        await log_result(feature.title, feature.description, to_legacy_result(result))
         
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Enhanced classification failed: {str(e)}")
 
+@app.post("/classify_enhanced_batch", response_model=List[EnhancedComplianceResult])
+async def classify_features_enhanced_batch(
+    batch: FeatureBatch
+):
+    """
+    Enhanced classification of several features in one request.
+    
+    Runs the same pipeline as /classify_enhanced for each item, sharing the
+    loaded classifier, and returns the results in request order.
+    """
+    try:
+        results = []
+        for feature in batch.items:
+            result = classify_feature_enhanced(feature.title, feature.description)
+            await log_result(feature.title, feature.description, to_legacy_result(result))
+            results.append(result)
+        
+        return results
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Enhanced batch classification failed: {str(e)}")
+
 @app.post("/batch_classify")
 async def batch_classify_features(
     file: UploadFile = File(...)
@@ -332,16 +364,7 @@ async def batch_classify_features(
             enhanced_classification = classify_feature_enhanced(title, description)
             
             # Convert to legacy format for batch processing compatibility
-            classification = ComplianceResult(
-                needs_geo_logic=enhanced_classification.needs_geo_logic,
-                confidence=enhanced_classification.overall_confidence,
-                reasoning=enhanced_classification.reasoning,
-                applicable_regulations=enhanced_classification.applicable_regulations,
-                risk_assessment=enhanced_classification.risk_assessment,
-                regulatory_requirements=enhanced_classification.regulatory_requirements,
-                evidence_sources=enhanced_classification.evidence_sources,
-                recommended_actions=enhanced_classification.recommended_actions
-            )
+            classification = to_legacy_result(enhanced_classification)
             
             # Log result
             await log_result(title, description, classification)
@@ -426,12 +449,14 @@ async def check_access(request: AccessRequest):
         )
 
 @app.get("/logs")
-async def get_access_logs(limit: int = 100):
+async def get_access_logs(limit: int = 100, before: Optional[str] = None):
     """
     Retrieve access logs from the database.
     
     Query parameters:
     - limit: Maximum number of logs to retrieve (default: 100)
+    - before: Opaque page cursor; pass the previous response's next_before to
+      fetch the next page (next_before is null on the last page)
     
     Returns:
     List of access log entries with user_id, feature_name, country, 
@@ -439,14 +464,17 @@ async def get_access_logs(limit: int = 100):
     """
     try:
         supabase_client = get_supabase_client()
-        logs = await supabase_client.get_access_logs(limit)
+        logs, next_before = await supabase_client.get_access_logs(limit, before)
         
         return {
             "logs": logs,
             "count": len(logs),
+            "next_before": next_before,
             "timestamp": datetime.now().isoformat()
         }
         
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(
             status_code=500,
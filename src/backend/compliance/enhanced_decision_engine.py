@@ -11,6 +11,8 @@ This module implements the threshold-based decision system described in the requ
 
 import json
 import os
+import hashlib
+from operator import itemgetter
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -49,6 +51,15 @@ class EnhancedDecisionEngine:
     def __init__(self, threshold_config_path: str = "threshold_config.json"):
         self.threshold_config = self._load_threshold_config(threshold_config_path)
         self.categories = self._build_category_map()
+        # (threshold, escalation rule) per category, read on every decision
+        self._threshold_rules = {
+            name: (category.confidence_threshold, category.escalation_rule)
+            for name, category in self.categories.items()
+        }
+        # Content hash of the thresholds, for callers that cache derived data
+        self.config_version = hashlib.sha256(
+            json.dumps(self.threshold_config["thresholds"], sort_keys=True).encode()
+        ).hexdigest()
         
     def _load_threshold_config(self, config_path: str) -> Dict[str, Any]:
         """Load threshold configuration from JSON file"""
@@ -132,10 +143,8 @@ class EnhancedDecisionEngine:
             return (0.70, EscalationRule.AUTO_OK)
         
         # Find the category with the highest threshold (strictest)
-        strictest_category = max(categories, key=lambda c: self.categories[c].confidence_threshold)
-        category_obj = self.categories[strictest_category]
-        
-        return (category_obj.confidence_threshold, category_obj.escalation_rule)
+        rules = self._threshold_rules
+        return max((rules[c] for c in categories), key=itemgetter(0))
     
     def make_decision(self, feature_text: str, llm_output: Dict[str, Any], 
                       rules_matched: List[str], rule_fired: bool) -> DecisionResult:
@@ -89,6 +89,11 @@ class GeoComplianceEngine:
         """
         results = []
         
+        # Warm the rule cache in one round trip so check_access doesn't
+        # fetch each feature's rule sequentially
+        feature_names = [r.get("feature_name") for r in requests if r.get("feature_name")]
+        await self.supabase_client.get_geo_rules_bulk(feature_names)
+        
         for request in requests:
             user_id = request.get("user_id")
             feature_name = request.get("feature_name")  
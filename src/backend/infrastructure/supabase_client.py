@@ -3,20 +3,291 @@ Supabase client configuration and utilities for geo-compliance system.
 """
 
 import os
-from supabase import create_client, Client
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+import json
+import base64
+import sqlite3
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
+from supabase import Client
+from supabase.lib.client_options import ClientOptions
+from typing import Optional, List, Dict, Any, Callable, Tuple
 import logging
+import httpx
+from dataclasses import dataclass, field
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import h2  # noqa: F401  (enables http2=True in httpx)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+
+# Set up logging (per-row chatter is DEBUG; production only surfaces warnings)
+logging.basicConfig(
+    level=logging.WARNING if os.getenv("ENVIRONMENT") == "production" else logging.INFO
+)
 logger = logging.getLogger(__name__)
 
-class SupabaseClient:
-    """Supabase client wrapper for geo-compliance operations."""
+# Columns of a geo rule as returned and cached, the same over asyncpg and PostgREST
+_GEO_RULE_COLUMNS = ("feature_name", "allowed_countries", "blocked_countries")
+
+# Hot-path geo rule lookup over asyncpg; prepared once per pooled connection
+# by asyncpg's statement cache
+_GEO_RULE_QUERY = (
+    f"SELECT {', '.join(_GEO_RULE_COLUMNS)} "
+    "FROM geo_rules WHERE feature_name = $1"
+)
+
+# Seconds to wait before retrying a failed Postgres pool connection
+_PG_POOL_RETRY_DELAY = 30.0
+
+# PostgREST resource path for the geo rule lookup
+_GEO_RULES_PATH = "/geo_rules"
+
+# Feature names per in.(...) filter, keeping request URLs well under length limits
+_GEO_RULES_CHUNK_SIZE = 500
+
+# Newest-first page order; id breaks ties between rows stamped by the same
+# transaction (one flushed batch shares a single now())
+_PAGE_ORDER = "timestamp.desc,id.desc"
+
+def _encode_cursor(row: Dict[str, Any]) -> str:
+    """Opaque (timestamp, id) keyset cursor pointing just past row."""
+    return base64.urlsafe_b64encode(json.dumps([row["timestamp"], row["id"]]).encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    Split a cursor from _encode_cursor back into (timestamp, id).
+    
+    Raises:
+        ValueError: If cursor was not produced by _encode_cursor
+    """
+    try:
+        timestamp, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid page cursor: {cursor!r}") from e
+    return timestamp, row_id
+
+def _quote(value: str) -> str:
+    """Double-quote a PostgREST filter value so ':', '+' and ',' are taken literally."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+def _in_filter(values: List[str]) -> str:
+    """Build a PostgREST in.(...) filter, quoting values that may contain commas or spaces."""
+    return f"in.({','.join(_quote(value) for value in values)})"
+
+class CircuitOpenError(Exception):
+    """Raised when Supabase calls are short-circuited by an open circuit breaker."""
+
+class _CircuitBreaker:
+    """
+    Fail fast after repeated Supabase errors.
+    
+    Opens after fail_max consecutive failures and rejects calls for
+    reset_timeout seconds. After that it is half-open: exactly one trial call
+    is let through, which closes the breaker on success or reopens it on
+    failure, and every other call keeps failing fast meanwhile. A trial that
+    never reports back (e.g. cancelled) is replaced after another
+    reset_timeout seconds.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_until = 0.0
+        # The client is a process-wide singleton, shared by every thread's event loop
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        return self._opened_at is not None and time.monotonic() - self._opened_at < self.reset_timeout
+    
+    def before_call(self):
+        """Raise CircuitOpenError if calls are being rejected."""
+        with self._lock:
+            if self._opened_at is None:
+                return
+            now = time.monotonic()
+            if now - self._opened_at < self.reset_timeout or now < self._trial_until:
+                raise CircuitOpenError("Supabase circuit breaker is open")
+            # Half-open: this caller is the trial
+            self._trial_until = now + self.reset_timeout
+    
+    def record_success(self):
+        """Close the breaker after a successful call."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_until = 0.0
+    
+    def record_failure(self):
+        """Count a failed call, opening the breaker at fail_max."""
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                if self._opened_at is None:
+                    logger.warning(
+                        "Supabase circuit breaker opened after %d consecutive failures", self._failures
+                    )
+                self._opened_at = time.monotonic()
+                self._trial_until = 0.0
+
+def _tune_postgrest_session(postgrest):
+    """
+    Swap a PostgREST client's HTTP session for one with HTTP/2 and a bounded pool.
+    
+    httpx already requests gzip bodies.
+    """
+    try:
+        session = postgrest.session
+        postgrest.session = httpx.Client(
+            base_url=session.base_url,
+            headers=session.headers,
+            timeout=session.timeout,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=10, max_keepalive_connections=10)
+        )
+        session.close()
+    except Exception as e:
+        logger.warning(f"Keeping default PostgREST session: {e}")
+
+class _TunedClient(Client):
+    """
+    supabase-py client whose PostgREST requests go through a tuned session.
+    
+    supabase-py 2.3 has no option for passing a custom httpx client and
+    rebuilds its PostgREST client on every auth state change, so the session
+    is swapped each time the accessor hands out a PostgREST client it has not
+    tuned yet. table() and rpc() go through the same accessor.
+    """
+    _tuned_postgrest = None
+    
+    @property
+    def postgrest(self):
+        postgrest = super().postgrest
+        if postgrest is not self._tuned_postgrest:
+            _tune_postgrest_session(postgrest)
+            self._tuned_postgrest = postgrest
+        return postgrest
+
+class _Singleton(type):
+    """Metaclass that hands out one shared instance per class."""
     
-    def __init__(self):
-        """Initialize Supabase client with environment variables."""
+    _instances: Dict[type, Any] = {}
+    _lock = threading.Lock()
+    
+    def __call__(cls, *args, **kwargs):
+        if cls not in cls._instances:
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super().__call__(*args, **kwargs)
+        return cls._instances[cls]
+
+class SupabaseClient(metaclass=_Singleton):
+    """
+    Supabase client wrapper for geo-compliance operations.
+    
+    Instantiating it anywhere returns the same process-wide instance, so the
+    underlying HTTP session and its keep-alive connections are shared.
+    """
+    
+    def __init__(
+        self,
+        async_insert_max_rows: int = 500,
+        async_insert_wait_time: float = 0.2,
+        insert_queue_max_rows: int = 10000,
+        pool_size: int = 5,
+        geo_rule_cache_ttl: float = 60.0,
+        geo_rule_cache_size: int = 1024,
+        copy_min_rows: int = 1000,
+        stats_reconcile_interval: float = 60.0,
+        breaker_fail_max: int = 5,
+        breaker_reset_timeout: float = 30.0
+    ):
+        """
+        Initialize Supabase client with environment variables.
+        
+        Args:
+            async_insert_max_rows: Flush buffered log rows once this many are queued
+            async_insert_wait_time: Flush buffered log rows after this many seconds
+            insert_queue_max_rows: Rows buffered per table before callers wait for
+                the flusher to catch up
+            pool_size: Number of concurrent Supabase requests (pool_size + max_overflow
+                of the Supabase session pooler)
+            geo_rule_cache_ttl: Seconds a fetched geo rule is served from cache
+            geo_rule_cache_size: Maximum number of cached geo rules (LRU eviction)
+            copy_min_rows: Batches of at least this many rows are written with
+                Postgres COPY when SUPABASE_DB_URL is set and asyncpg is installed.
+                If SUPABASE_POOLER_DSN (Supavisor transaction mode, port 6543) is
+                set instead, every batch is written through the pooler
+            stats_reconcile_interval: Seconds between reloads of the running
+                classification statistics from Postgres
+            breaker_fail_max: Consecutive Supabase failures before failing fast
+            breaker_reset_timeout: Seconds to fail fast before retrying Supabase
+        """
+        self.async_insert_max_rows = async_insert_max_rows
+        self.async_insert_wait_time = async_insert_wait_time
+        self.insert_queue_max_rows = insert_queue_max_rows
+        
+        # Buffered inserts: one bounded queue and flusher task per table, created
+        # lazily on the running event loop the first time a row is logged
+        self._insert_queues: Dict[str, asyncio.Queue] = {}
+        self._flusher_tasks: Dict[str, asyncio.Task] = {}
+        self._insert_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Direct Postgres connection for bulk COPY and geo rule lookups,
+        # created lazily like the queues
+        self.copy_min_rows = copy_min_rows
+        self.database_url = os.getenv("SUPABASE_DB_URL")
+        self.pooler_dsn = os.getenv("SUPABASE_POOLER_DSN")
+        self._pg_pool = None
+        self._pg_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pg_pool_retry_at = 0.0
+        
+        # feature_name -> (rule or None, expires_at), in least-recently-used order
+        self.geo_rule_cache_ttl = geo_rule_cache_ttl
+        self.geo_rule_cache_size = geo_rule_cache_size
+        self._geo_rule_cache: "OrderedDict[str, Tuple[Optional[Dict[str, Any]], float]]" = OrderedDict()
+        
+        # Running classification statistics, updated on every flushed batch
+        self.stats_reconcile_interval = stats_reconcile_interval
+        self._stats: Optional[_ClassificationStats] = None
+        self._stats_expires_at = 0.0
+        
+        # supabase-py is synchronous; run its requests off the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(pool_size, 10),
+            thread_name_prefix="supabase"
+        )
+        self._breaker = _CircuitBreaker(breaker_fail_max, breaker_reset_timeout)
+        
+        # Batches that could not be written are spooled to a local SQLite file
+        # and replayed after the next successful write
+        self.spool_path = os.getenv("SUPABASE_SPOOL_PATH", "data/supabase_spool.db")
+        self._spool_pending = os.path.exists(self.spool_path)
+        # Held while a replay runs: every table's flusher may try to replay
+        # after a successful write, and two replays would read and post the
+        # same undeleted rows. A thread lock also covers flushers on other loops
+        self._replay_lock = threading.Lock()
+        
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_ANON_KEY")
         
@@ -25,7 +296,11 @@ class SupabaseClient:
             self.client = None
         else:
             try:
-                self.client: Client = create_client(self.supabase_url, self.supabase_key)
+                self.client: Client = _TunedClient.create(
+                    self.supabase_url,
+                    self.supabase_key,
+                    options=ClientOptions(postgrest_client_timeout=30)
+                )
                 logger.info("Supabase client initialized successfully")
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
@@ -35,10 +310,300 @@ class SupabaseClient:
         """Check if Supabase client is properly connected."""
         return self.client is not None
     
+    async def _run(self, fn: Callable[[], Any]) -> Any:
+        """
+        Run a blocking Supabase call in the bounded executor.
+        
+        Raises:
+            CircuitOpenError: If recent calls failed and Supabase is being skipped
+        """
+        self._breaker.before_call()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(self._executor, fn)
+        except Exception:
+            self._breaker.record_failure()
+            raise
+        self._breaker.record_success()
+        return result
+    
+    def _get_insert_queue(self, table_name: str) -> asyncio.Queue:
+        """Get the insert queue for a table, starting its flusher if needed."""
+        loop = asyncio.get_running_loop()
+        if self._insert_loop is not loop:
+            # Queues and tasks are bound to the loop that created them
+            self._spool_stale_queues()
+            self._insert_queues = {}
+            self._flusher_tasks = {}
+            self._insert_loop = loop
+        
+        queue = self._insert_queues.get(table_name)
+        if queue is None:
+            # A full queue makes put() wait, pushing back on callers while the
+            # flusher (or the spool, if Supabase is down) catches up
+            queue = asyncio.Queue(maxsize=self.insert_queue_max_rows)
+            self._insert_queues[table_name] = queue
+        
+        task = self._flusher_tasks.get(table_name)
+        if task is None or task.done():
+            self._flusher_tasks[table_name] = loop.create_task(self._flusher(queue, table_name))
+        
+        return queue
+    
+    def _spool_stale_queues(self):
+        """
+        Move rows still buffered for a previous event loop to the local spool.
+        
+        They are replayed after the next successful write instead of being
+        dropped with the old queues. Rows the old flusher was still collecting
+        were spooled when it was cancelled.
+        """
+        for table_name, queue in self._insert_queues.items():
+            # Tasks blocked in put() were cancelled with their loop, so draining
+            # has no waiters on the old loop to wake
+            rows = []
+            while not queue.empty():
+                rows.append(queue.get_nowait())
+            if rows:
+                logger.warning(
+                    "Event loop changed with %d unflushed rows for %s; spooling them",
+                    len(rows), table_name
+                )
+                self._spool_rows(table_name, rows)
+    
+    async def _flusher(self, queue: asyncio.Queue, table_name: str):
+        """
+        Drain a queue into batched inserts.
+        
+        A batch is flushed once async_insert_max_rows rows are buffered or
+        async_insert_wait_time seconds have passed since its first row.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            rows = [await queue.get()]
+            deadline = loop.time() + self.async_insert_wait_time
+            
+            try:
+                while len(rows) < self.async_insert_max_rows:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        rows.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Cancelled (e.g. its event loop shutting down) while collecting
+                # a batch: keep the rows already taken for replay
+                self._spool_rows(table_name, rows)
+                raise
+            
+            try:
+                if await self._insert_rows(table_name, rows) and table_name == "classification_results":
+                    if self._stats is not None:
+                        for row in rows:
+                            self._stats.add(row)
+            finally:
+                for _ in rows:
+                    queue.task_done()
+    
+    async def _get_pg_pool(self):
+        """Get the asyncpg pool, or None if not configured or unreachable."""
+        if not ASYNCPG_AVAILABLE or not (self.pooler_dsn or self.database_url):
+            return None
+        
+        loop = asyncio.get_running_loop()
+        if self._pg_pool is not None and self._pg_pool_loop is loop:
+            return self._pg_pool
+        if time.monotonic() < self._pg_pool_retry_at:
+            return None
+        
+        try:
+            if self.pooler_dsn:
+                # Transaction-mode pooler: stay within the pooler's client cap
+                # (pool_size=3 + max_overflow=2), recycle idle connections, and
+                # skip named prepared statements, which it does not support
+                self._pg_pool = await asyncpg.create_pool(
+                    self.pooler_dsn,
+                    min_size=1,
+                    max_size=5,
+                    max_inactive_connection_lifetime=1800,
+                    statement_cache_size=0,
+                    timeout=30
+                )
+            else:
+                self._pg_pool = await asyncpg.create_pool(self.database_url, min_size=2, max_size=10)
+            self._pg_pool_loop = loop
+            return self._pg_pool
+            
+        except Exception as e:
+            logger.error(f"Failed to connect to Postgres, retrying in {_PG_POOL_RETRY_DELAY:.0f}s: {e}")
+            self._pg_pool = None
+            self._pg_pool_retry_at = time.monotonic() + _PG_POOL_RETRY_DELAY
+            return None
+    
+    async def _copy_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> bool:
+        """Write a batch of rows with Postgres COPY, bypassing PostgREST."""
+        pool = await self._get_pg_pool()
+        if pool is None:
+            return False
+        
+        started = time.perf_counter()
+        try:
+            columns = list(rows[0].keys())
+            records = [tuple(row[column] for column in columns) for row in rows]
+            async with pool.acquire() as conn:
+                await conn.copy_records_to_table(table_name, records=records, columns=columns)
+            
+            logger.info(
+                "Copied %d rows to %s in %.1f ms",
+                len(rows), table_name, (time.perf_counter() - started) * 1000
+            )
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error copying {len(rows)} rows to {table_name}, falling back to REST insert: {e}")
+            return False
+    
+    def _post_rows(self, table_name: str, rows: List[Dict[str, Any]]):
+        """
+        POST a batch of rows straight to PostgREST.
+        
+        The body is serialized with orjson when available instead of going
+        through the query builder and stdlib json, and return=minimal skips
+        echoing the rows back.
+        """
+        body = orjson.dumps(rows) if ORJSON_AVAILABLE else json.dumps(rows).encode("utf-8")
+        response = self.client.postgrest.session.post(
+            f"/{table_name}",
+            content=body,
+            headers={"Content-Type": "application/json", "Prefer": "return=minimal"}
+        )
+        response.raise_for_status()
+    
+    async def _insert_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> bool:
+        """Insert a batch of rows in a single request."""
+        use_copy = self.pooler_dsn or len(rows) >= self.copy_min_rows
+        if use_copy and await self._copy_rows(table_name, rows):
+            return True
+        
+        started = time.perf_counter()
+        try:
+            await self._run(lambda: self._post_rows(table_name, rows))
+            logger.info(
+                "Flushed %d rows to %s in %.1f ms",
+                len(rows), table_name, (time.perf_counter() - started) * 1000
+            )
+            
+        except Exception as e:
+            logger.error(f"Error flushing {len(rows)} rows to {table_name}, spooling locally: {e}")
+            await asyncio.to_thread(self._spool_rows, table_name, rows)
+            return False
+        
+        if self._spool_pending:
+            await self._replay_spool()
+        return True
+    
+    def _spool_rows(self, table_name: str, rows: List[Dict[str, Any]]):
+        """Append unwritten rows to the local SQLite spool."""
+        try:
+            os.makedirs(os.path.dirname(self.spool_path) or ".", exist_ok=True)
+            with closing(sqlite3.connect(self.spool_path)) as conn, conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pending_rows ("
+                    "id INTEGER PRIMARY KEY AUTOINCREMENT, table_name TEXT NOT NULL, row TEXT NOT NULL)"
+                )
+                conn.executemany(
+                    "INSERT INTO pending_rows (table_name, row) VALUES (?, ?)",
+                    [(table_name, json.dumps(row)) for row in rows]
+                )
+            self._spool_pending = True
+        except Exception as e:
+            logger.error(f"Error spooling {len(rows)} rows for {table_name}, rows lost: {e}")
+    
+    def _read_spool(self, limit: int) -> Dict[str, Tuple[List[int], List[Dict[str, Any]]]]:
+        """Read up to limit spooled rows, grouped by table as (ids, rows)."""
+        batches: Dict[str, Tuple[List[int], List[Dict[str, Any]]]] = {}
+        with closing(sqlite3.connect(self.spool_path)) as conn:
+            spooled = conn.execute(
+                "SELECT id, table_name, row FROM pending_rows ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+        for row_id, table_name, row in spooled:
+            ids, rows = batches.setdefault(table_name, ([], []))
+            ids.append(row_id)
+            rows.append(json.loads(row))
+        return batches
+    
+    def _delete_spooled(self, ids: List[int]):
+        """Remove replayed rows from the spool."""
+        with closing(sqlite3.connect(self.spool_path)) as conn, conn:
+            conn.executemany("DELETE FROM pending_rows WHERE id = ?", [(row_id,) for row_id in ids])
+    
+    async def _replay_spool(self):
+        """
+        Re-insert spooled rows, one batch at a time, until the spool is empty.
+        
+        Returns at once if another flusher is already replaying.
+        """
+        if not self._replay_lock.acquire(blocking=False):
+            return
+        try:
+            await self._replay_spooled_batches()
+        finally:
+            self._replay_lock.release()
+    
+    async def _replay_spooled_batches(self):
+        """Replay loop behind _replay_spool; only run while holding _replay_lock."""
+        while True:
+            try:
+                batches = await asyncio.to_thread(self._read_spool, self.async_insert_max_rows)
+            except sqlite3.Error as e:
+                logger.error(f"Error reading write spool: {e}")
+                return
+            
+            if not batches:
+                self._spool_pending = False
+                return
+            
+            for table_name, (ids, rows) in batches.items():
+                try:
+                    await self._run(lambda: self._post_rows(table_name, rows))
+                except Exception as e:
+                    logger.warning(f"Replaying spooled rows for {table_name} failed, will retry: {e}")
+                    return
+                await asyncio.to_thread(self._delete_spooled, ids)
+                logger.info("Replayed %d spooled rows to %s", len(rows), table_name)
+                
+                # Spooled rows were never counted when their flush failed
+                if table_name == "classification_results" and self._stats is not None:
+                    for row in rows:
+                        self._stats.add(row)
+    
+    async def flush(self):
+        """Wait until every buffered row has been written."""
+        for queue in list(self._insert_queues.values()):
+            await queue.join()
+    
+    async def aclose(self):
+        """Flush buffered rows and stop the background flushers."""
+        await self.flush()
+        
+        for task in self._flusher_tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._flusher_tasks.values(), return_exceptions=True)
+        self._flusher_tasks = {}
+        
+        if self._pg_pool is not None:
+            await self._pg_pool.close()
+            self._pg_pool = None
+    
     async def get_geo_rule(self, feature_name: str) -> Optional[Dict[str, Any]]:
         """
         Get geo-compliance rule for a specific feature.
         
+        Results are cached for geo_rule_cache_ttl seconds per feature. Cache
+        misses go over asyncpg when a Postgres DSN is configured, else PostgREST.
+        
         Args:
             feature_name: Name of the feature to check
             
@@ -48,18 +613,121 @@ class SupabaseClient:
         if not self.client:
             logger.error("Supabase client not initialized")
             return None
+        
+        cached = self._geo_rule_cache.get(feature_name)
+        if cached is not None:
+            rule, expires_at = cached
+            if expires_at > time.monotonic():
+                self._geo_rule_cache.move_to_end(feature_name)
+                return rule
             
         try:
-            response = self.client.table("geo_rules").select("*").eq("feature_name", feature_name).execute()
+            pool = await self._get_pg_pool()
+            if pool is not None:
+                try:
+                    async with pool.acquire() as conn:
+                        record = await conn.fetchrow(_GEO_RULE_QUERY, feature_name)
+                    rule = dict(record) if record else None
+                    self._cache_geo_rule(feature_name, rule)
+                    return rule
+                except Exception as e:
+                    logger.warning(f"Postgres geo rule lookup failed, falling back to REST: {e}")
             
-            if response.data:
-                return response.data[0]
-            return None
+            rows = await self._run(lambda: self._select_geo_rules(f"eq.{feature_name}"))
+            
+            rule = rows[0] if rows else None
+            self._cache_geo_rule(feature_name, rule)
+            return rule
             
         except Exception as e:
+            if cached is not None:
+                # Supabase is degraded; a stale rule beats denying every request
+                logger.warning(f"Serving stale geo rule for {feature_name}: {e}")
+                return cached[0]
             logger.error(f"Error fetching geo rule for {feature_name}: {e}")
             return None
     
+    async def get_geo_rules_bulk(self, feature_names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Get geo-compliance rules for several features in one round trip.
+        
+        Cached rules are served directly; the rest are fetched with a single
+        in.(...) query per chunk of _GEO_RULES_CHUNK_SIZE names and cached.
+        
+        Args:
+            feature_names: Names of the features to check
+            
+        Returns:
+            Dict mapping each feature name to its rule, or None if not found
+        """
+        if not self.client:
+            logger.error("Supabase client not initialized")
+            return {}
+        
+        rules: Dict[str, Optional[Dict[str, Any]]] = {}
+        missing = []
+        now = time.monotonic()
+        for feature_name in dict.fromkeys(feature_names):
+            cached = self._geo_rule_cache.get(feature_name)
+            if cached is not None and cached[1] > now:
+                rules[feature_name] = cached[0]
+            else:
+                missing.append(feature_name)
+        
+        chunks = [
+            missing[i:i + _GEO_RULES_CHUNK_SIZE]
+            for i in range(0, len(missing), _GEO_RULES_CHUNK_SIZE)
+        ]
+        try:
+            results = await asyncio.gather(*(
+                self._run(lambda chunk=chunk: self._select_geo_rules(_in_filter(chunk)))
+                for chunk in chunks
+            ))
+        except Exception as e:
+            logger.error(f"Error fetching geo rules for {len(missing)} features: {e}")
+            return rules
+        
+        found = {row["feature_name"]: row for rows in results for row in rows}
+        for feature_name in missing:
+            rule = found.get(feature_name)
+            self._cache_geo_rule(feature_name, rule)
+            rules[feature_name] = rule
+        
+        return rules
+    
+    def _select_geo_rules(self, feature_filter: str) -> List[Dict[str, Any]]:
+        """
+        Fetch geo_rules rows matching a PostgREST feature_name filter.
+        
+        postgrest-py builders mutate in place and cannot be reused, so this hot
+        lookup sends the fixed GET directly instead of rebuilding the chain.
+        """
+        response = self.client.postgrest.session.get(
+            _GEO_RULES_PATH,
+            params={"select": ",".join(_GEO_RULE_COLUMNS), "feature_name": feature_filter}
+        )
+        response.raise_for_status()
+        return response.json()
+    
+    def _cache_geo_rule(self, feature_name: str, rule: Optional[Dict[str, Any]]):
+        """Store a geo rule lookup result, evicting the least recently used entry."""
+        self._geo_rule_cache[feature_name] = (rule, time.monotonic() + self.geo_rule_cache_ttl)
+        self._geo_rule_cache.move_to_end(feature_name)
+        while len(self._geo_rule_cache) > self.geo_rule_cache_size:
+            self._geo_rule_cache.popitem(last=False)
+    
+    def invalidate_geo_rule(self, feature_name: Optional[str] = None):
+        """
+        Drop a cached geo rule so the next lookup hits Supabase.
+        
+        Args:
+            feature_name: Feature to invalidate, or None to clear the whole cache
+        """
+        if feature_name is None:
+            self._geo_rule_cache.clear()
+        else:
+            self._geo_rule_cache.pop(feature_name, None)
+    
     async def log_access_attempt(
         self, 
         user_id: str, 
@@ -70,6 +738,9 @@ class SupabaseClient:
         """
         Log an access attempt to the access_logs table.
         
+        The row is buffered and written in a batch by the background flusher.
+        If the buffer is full, this waits until the flusher makes room.
+        
         Args:
             user_id: ID of the user making the request
             feature_name: Name of the feature being accessed
@@ -77,75 +748,86 @@ class SupabaseClient:
             access_granted: Whether access was granted or denied
             
         Returns:
-            True if logged successfully, False otherwise
+            True once the row is queued, False otherwise. A queued row is not
+            yet written; if its batch fails it is spooled locally and replayed
+            later, and the failure is only logged
         """
         if not self.client:
             logger.error("Supabase client not initialized")
             return False
             
         try:
+            # timestamp is stamped server-side by the column's DEFAULT now()
             log_data = {
                 "user_id": user_id,
                 "feature_name": feature_name,
                 "country": country,
-                "access_granted": access_granted,
-                "timestamp": datetime.utcnow().isoformat()
+                "access_granted": access_granted
             }
             
-            response = self.client.table("access_logs").insert(log_data).execute()
-            
-            if response.data:
-                logger.info(f"Access attempt logged for user {user_id}, feature {feature_name}")
-                return True
-            return False
+            await self._get_insert_queue("access_logs").put(log_data)
+            logger.debug("Access attempt logged for user %s, feature %s", user_id, feature_name)
+            return True
             
         except Exception as e:
             logger.error(f"Error logging access attempt: {e}")
             return False
     
-    async def get_access_logs(self, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_access_logs(
+        self,
+        limit: int = 100,
+        before: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
         Retrieve access logs from the database.
         
         Args:
             limit: Maximum number of logs to retrieve
+            before: Cursor from a previous call; only entries after it are returned
             
         Returns:
-            List of access log entries
+            Tuple of (newest-first access log entries, cursor for the next page,
+            or None once the last page has been returned)
+        
+        Raises:
+            ValueError: If before is not a cursor returned by this method
         """
+        after = _decode_cursor(before) if before else None
         if not self.client:
             logger.error("Supabase client not initialized")
-            return []
+            return [], None
             
         try:
-            response = self.client.table("access_logs").select("*").order("timestamp", desc=True).limit(limit).execute()
-            
-            return response.data if response.data else []
+            rows = await self._run(lambda: self._select_page("access_logs", limit, after))
+            return rows, _encode_cursor(rows[-1]) if len(rows) == limit else None
             
         except Exception as e:
             logger.error(f"Error fetching access logs: {e}")
-            return []
+            return [], None
     
     async def create_geo_rule(
         self, 
         feature_name: str, 
         allowed_countries: List[str] = None, 
         blocked_countries: List[str] = None
-    ) -> bool:
+    ) -> Optional[Dict[str, Any]]:
         """
         Create or update a geo-compliance rule.
         
+        The upsert returns the stored row, which also refreshes the geo rule
+        cache so the next get_geo_rule is served without a round trip.
+        
         Args:
             feature_name: Name of the feature
             allowed_countries: List of allowed country codes
             blocked_countries: List of blocked country codes
             
         Returns:
-            True if created/updated successfully, False otherwise
+            The stored rule if created/updated successfully, None otherwise
         """
         if not self.client:
             logger.error("Supabase client not initialized")
-            return False
+            return None
             
         try:
             rule_data = {
@@ -155,16 +837,23 @@ class SupabaseClient:
             }
             
             # Use upsert to create or update
-            response = self.client.table("geo_rules").upsert(rule_data).execute()
+            response = await self._run(
+                lambda: self.client.table("geo_rules").upsert(rule_data, returning="representation").execute()
+            )
             
             if response.data:
+                rule = response.data[0]
+                self._cache_geo_rule(feature_name, rule)
                 logger.info(f"Geo rule created/updated for feature {feature_name}")
-                return True
-            return False
+                return rule
+            
+            self.invalidate_geo_rule(feature_name)
+            return None
             
         except Exception as e:
+            self.invalidate_geo_rule(feature_name)
             logger.error(f"Error creating geo rule: {e}")
-            return False
+            return None
     
     async def log_classification_result(
         self,
@@ -180,6 +869,9 @@ class SupabaseClient:
         """
         Log a classification result to the classification_results table.
         
+        The row is buffered and written in a batch by the background flusher.
+        If the buffer is full, this waits until the flusher makes room.
+        
         Args:
             title: Feature title
             description: Feature description
@@ -191,13 +883,15 @@ class SupabaseClient:
             specific_requirements: List of specific requirements
             
         Returns:
-            True if logged successfully, False otherwise
+            True once the row is queued, False otherwise; as with
+            log_access_attempt, a queued row is not yet written
         """
         if not self.client:
             logger.error("Supabase client not initialized")
             return False
             
         try:
+            # timestamp is stamped server-side by the column's DEFAULT now()
             classification_data = {
                 "title": title,
                 "description": description,
@@ -206,114 +900,267 @@ class SupabaseClient:
                 "reasoning": reasoning,
                 "regulations": regulations,
                 "risk_level": risk_level,
-                "specific_requirements": specific_requirements,
-                "timestamp": datetime.utcnow().isoformat()
+                "specific_requirements": specific_requirements
             }
             
-            response = self.client.table("classification_results").insert(classification_data).execute()
-            
-            if response.data:
-                logger.info(f"Classification result logged for feature: {title}")
-                return True
-            return False
+            await self._get_insert_queue("classification_results").put(classification_data)
+            logger.debug("Classification result logged for feature: %s", title)
+            return True
             
         except Exception as e:
             logger.error(f"Error logging classification result: {e}")
             return False
     
-    async def get_classification_results(self, limit: int = 100) -> List[Dict[str, Any]]:
+    async def get_classification_results(
+        self,
+        limit: int = 100,
+        before: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
         """
         Retrieve classification results from the database.
         
         Args:
             limit: Maximum number of results to retrieve
+            before: Cursor from a previous call; only entries after it are returned
             
         Returns:
-            List of classification result entries
+            Tuple of (newest-first classification result entries, cursor for the next
+            page, or None once the last page has been returned)
+        
+        Raises:
+            ValueError: If before is not a cursor returned by this method
         """
+        after = _decode_cursor(before) if before else None
         if not self.client:
             logger.error("Supabase client not initialized")
-            return []
+            return [], None
             
         try:
-            response = self.client.table("classification_results").select("*").order("timestamp", desc=True).limit(limit).execute()
-            
-            return response.data if response.data else []
+            rows = await self._run(lambda: self._select_page("classification_results", limit, after))
+            return rows, _encode_cursor(rows[-1]) if len(rows) == limit else None
             
         except Exception as e:
             logger.error(f"Error fetching classification results: {e}")
-            return []
+            return [], None
+    
+    def _select_page(
+        self,
+        table_name: str,
+        limit: int,
+        after: Optional[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one newest-first page of rows, keyset-paginated on (timestamp, id).
+        
+        Rows flushed in one batch share a timestamp, so the cursor carries the
+        id as a tie-breaker, matching the (timestamp DESC, id DESC) index. Sent as a
+        direct GET, like _select_geo_rules, so the compound order and or-filter
+        go out exactly as written.
+        """
+        params = {"select": "*", "order": _PAGE_ORDER, "limit": str(limit)}
+        if after:
+            timestamp, row_id = _quote(after[0]), _quote(str(after[1]))
+            params["or"] = f"(timestamp.lt.{timestamp},and(timestamp.eq.{timestamp},id.lt.{row_id}))"
+        
+        response = self.client.postgrest.session.get(f"/{table_name}", params=params)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _count_rows(self, table_name: str, **filters: Any) -> int:
+        """
+        Count rows matching equality filters without transferring any rows.
+        
+        Sent as a HEAD request on the PostgREST session: the postgrest-py
+        versions supabase 2.3.0 allows have no head option on select(), and
+        their column-less select() issues a HEAD but reports count=0 when the
+        empty body fails to parse. The exact count is read from Content-Range.
+        
+        Args:
+            table_name: Table to count
+            **filters: column=value equality filters
+            
+        Returns:
+            Exact number of matching rows
+        """
+        params = {"select": "id"}
+        for column, value in filters.items():
+            params[column] = f"eq.{str(value).lower() if isinstance(value, bool) else value}"
+        
+        def query():
+            response = self.client.postgrest.session.head(
+                f"/{table_name}", params=params, headers={"Prefer": "count=exact"}
+            )
+            response.raise_for_status()
+            return response.headers.get("content-range", "")
+        
+        # Content-Range is "*/<total>" for a HEAD request
+        total = (await self._run(query)).rpartition("/")[2]
+        return int(total) if total.isdigit() else 0
+    
+    async def _sum_confidence(self) -> Tuple[float, int]:
+        """
+        Sum and count non-NULL classification confidences in Postgres.
+        
+        Uses PostgREST aggregate functions, which need db-aggregates-enabled;
+        without them the average is dropped rather than pulling every row.
+        
+        Returns:
+            (sum, count) of confidences, or (0.0, 0) if aggregates are disabled
+        """
+        try:
+            response = await self._run(
+                lambda: self.client.table("classification_results")
+                .select("confidence.sum(),confidence.count()")
+                .execute()
+            )
+        except Exception as e:
+            logger.warning(f"PostgREST aggregates unavailable, omitting average confidence: {e}")
+            return 0.0, 0
+        
+        row = response.data[0] if response.data else {}
+        return float(row.get("sum") or 0.0), row.get("count") or 0
     
     async def get_classification_statistics(self) -> Dict[str, Any]:
         """
         Get classification statistics from Supabase.
         
+        Served from a running aggregate that the insert flusher keeps up to
+        date; it is reloaded from Postgres every stats_reconcile_interval
+        seconds to correct drift (e.g. rows written by other processes).
+        
         Returns:
             Dictionary with classification statistics
         """
         if not self.client:
             logger.error("Supabase client not initialized")
-            return {
-                "total_classifications": 0,
-                "compliance_required": 0,
-                "no_compliance_needed": 0,
-                "average_confidence": 0.0,
-                "risk_levels": {"low": 0, "medium": 0, "high": 0}
-            }
+            return _empty_statistics()
+        
+        if self._stats is not None and time.monotonic() < self._stats_expires_at:
+            return self._stats.to_dict()
+        
+        stats = await self._load_classification_statistics()
+        if stats is None:
+            return _empty_statistics()
+        
+        self._stats = stats
+        self._stats_expires_at = time.monotonic() + self.stats_reconcile_interval
+        return stats.to_dict()
+    
+    async def _load_classification_statistics(self) -> Optional["_ClassificationStats"]:
+        """
+        Aggregate classification statistics in Supabase.
+        
+        Aggregation runs in Postgres via the classification_stats() function
+        (see scripts/setup_supabase.py); if it is not deployed, rows are
+        counted with HEAD requests and confidence summed with a PostgREST
+        aggregate instead, so no rows are transferred either way.
+        
+        Returns:
+            Aggregate seeded from the table, with confidence kept as an exact
+            sum and count, or None if Supabase could not be queried
+        """
+        try:
+            response = await self._run(
+                lambda: self.client.rpc("classification_stats", {}).execute()
+            )
             
+            if response.data:
+                row = response.data[0]
+                return _ClassificationStats(
+                    total=row.get("total") or 0,
+                    compliance_required=row.get("compliance_required") or 0,
+                    no_compliance_needed=row.get("no_compliance") or 0,
+                    confidence_sum=float(row.get("sum_conf") or 0.0),
+                    confidence_count=row.get("count_conf") or 0,
+                    risk_levels={
+                        "low": row.get("low") or 0,
+                        "medium": row.get("medium") or 0,
+                        "high": row.get("high") or 0
+                    }
+                )
+            return _ClassificationStats()
+            
+        except Exception as e:
+            logger.warning(f"classification_stats RPC unavailable, falling back to count queries: {e}")
+        
         try:
-            # Get all classification results
-            response = self.client.table("classification_results").select("*").execute()
-            results = response.data if response.data else []
-            
-            if not results:
-                return {
-                    "total_classifications": 0,
-                    "compliance_required": 0,
-                    "no_compliance_needed": 0,
-                    "average_confidence": 0.0,
-                    "risk_levels": {"low": 0, "medium": 0, "high": 0}
-                }
-            
-            total = len(results)
-            compliance_required = len([r for r in results if r.get('needs_geo_logic') == True])
-            no_compliance_needed = len([r for r in results if r.get('needs_geo_logic') == False])
-            
-            # Calculate average confidence
-            confidences = [r.get('confidence', 0) for r in results if r.get('confidence') is not None]
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
-            
-            # Count risk levels
-            risk_levels = {"low": 0, "medium": 0, "high": 0}
-            for result in results:
-                risk_level = result.get('risk_level', '').lower()
-                if risk_level in risk_levels:
-                    risk_levels[risk_level] += 1
-            
-            return {
-                "total_classifications": total,
-                "compliance_required": compliance_required,
-                "no_compliance_needed": no_compliance_needed,
-                "average_confidence": round(avg_confidence, 3),
-                "risk_levels": risk_levels
-            }
+            # Counts come back in the Content-Range header with no row bodies
+            (
+                total, compliance_required, no_compliance_needed,
+                low, medium, high, (confidence_sum, confidence_count)
+            ) = await asyncio.gather(
+                self._count_rows("classification_results"),
+                self._count_rows("classification_results", needs_geo_logic=True),
+                self._count_rows("classification_results", needs_geo_logic=False),
+                self._count_rows("classification_results", risk_level="low"),
+                self._count_rows("classification_results", risk_level="medium"),
+                self._count_rows("classification_results", risk_level="high"),
+                self._sum_confidence()
+            )
+            
+            if not total:
+                return _ClassificationStats()
+            
+            return _ClassificationStats(
+                total=total,
+                compliance_required=compliance_required,
+                no_compliance_needed=no_compliance_needed,
+                confidence_sum=confidence_sum,
+                confidence_count=confidence_count,
+                risk_levels={"low": low, "medium": medium, "high": high}
+            )
             
         except Exception as e:
             logger.error(f"Error fetching classification statistics: {e}")
-            return {
-                "total_classifications": 0,
-                "compliance_required": 0,
-                "no_compliance_needed": 0,
-                "average_confidence": 0.0,
-                "risk_levels": {"low": 0, "medium": 0, "high": 0}
-            }
+            return None
+
+@dataclass
+class _ClassificationStats:
+    """Running aggregate behind get_classification_statistics."""
+    total: int = 0
+    compliance_required: int = 0
+    no_compliance_needed: int = 0
+    confidence_sum: float = 0.0
+    confidence_count: int = 0
+    risk_levels: Dict[str, int] = field(default_factory=lambda: {"low": 0, "medium": 0, "high": 0})
+    
+    def add(self, row: Dict[str, Any]):
+        """Fold one inserted classification_results row into the aggregate."""
+        self.total += 1
+        if row.get("needs_geo_logic") is True:
+            self.compliance_required += 1
+        elif row.get("needs_geo_logic") is False:
+            self.no_compliance_needed += 1
+        
+        if row.get("confidence") is not None:
+            self.confidence_sum += row["confidence"]
+            self.confidence_count += 1
+        
+        risk_level = (row.get("risk_level") or "").lower()
+        if risk_level in self.risk_levels:
+            self.risk_levels[risk_level] += 1
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Statistics payload in the shape returned by the API."""
+        avg_confidence = self.confidence_sum / self.confidence_count if self.confidence_count else 0.0
+        return {
+            "total_classifications": self.total,
+            "compliance_required": self.compliance_required,
+            "no_compliance_needed": self.no_compliance_needed,
+            "average_confidence": round(avg_confidence, 3),
+            "risk_levels": dict(self.risk_levels)
+        }
 
-# Global instance
-_supabase_client = None
+def _empty_statistics() -> Dict[str, Any]:
+    """Statistics payload for an empty or unreachable classification_results table."""
+    return {
+        "total_classifications": 0,
+        "compliance_required": 0,
+        "no_compliance_needed": 0,
+        "average_confidence": 0.0,
+        "risk_levels": {"low": 0, "medium": 0, "high": 0}
+    }
 
 def get_supabase_client() -> SupabaseClient:
     """Get or create the global Supabase client instance."""
-    global _supabase_client
-    if _supabase_client is None:
-        _supabase_client = SupabaseClient()
-    return _supabase_client
+    return SupabaseClient()
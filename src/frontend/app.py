@@ -1,10 +1,38 @@
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import numpy as np
 import pandas as pd
 import json
 import io
-from datetime import datetime
+import logging
+import math
+from datetime import datetime, timezone
+from pathlib import Path
 import os
+import re
+import sys
+import time
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, default=str, sort_keys=True).encode()
+
+try:
+    import pyarrow  # noqa: F401
+    # Parse uploaded CSVs with Arrow's multithreaded reader into Arrow-backed columns
+    _CSV_OPTIONS = {"engine": "pyarrow", "dtype_backend": "pyarrow"}
+except ImportError:
+    _CSV_OPTIONS = {}
 
 # Page configuration
 st.set_page_config(
@@ -14,548 +42,152 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_data(show_spinner=False)
+def _load_css() -> str:
+    """Read the app stylesheet once and wrap it for st.markdown"""
+    with open(os.path.join(os.path.dirname(__file__), "styles.css")) as f:
+        return "<style>" + f.read() + "</style>"
+
 # Enhanced UI Styling with Proper Contrast
-st.markdown("""
-<style>
-    /* Import Google Fonts */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-    
-    /* Global Styling - Simple and Clean */
-    .stApp {
-        font-family: 'Inter', sans-serif;
-        background-color: #f8fafc;
-    }
-    
-    /* Force most text to be visible */
-    .stApp, .stApp * {
-        color: #1a202c !important;
-    }
-    
-    /* Main content container with gradient background for white text areas */
-    .main .block-container {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        border-radius: 12px;
-        padding: 2rem;
-        margin: 1rem;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.05);
-        color: #1a202c !important;
-    }
-    
-    /* White text for input areas */
-    .stTextInput label, .stTextArea label {
-        color: white !important;
-    }
-    
-    /* White text for form inputs when they have content */
-    .stTextInput input, .stTextArea textarea {
-        color: white !important;
-        background-color: rgba(255, 255, 255, 0.1) !important;
-        border: 1px solid rgba(255, 255, 255, 0.3) !important;
-    }
-    
-    .stTextInput input::placeholder, .stTextArea textarea::placeholder {
-        color: rgba(255, 255, 255, 0.7) !important;
-    }
-    
-    /* Results area with white background for dark text */
-    .results-container {
-        background-color: white;
-        border-radius: 8px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    
-    .results-container * {
-        color: #1a202c !important;
-    }
-    
-    /* Header styling - Simplified */
-    .main-header {
-        text-align: center;
-        padding: 2rem;
-        background: linear-gradient(135deg, #4c51bf 0%, #667eea 100%);
-        border-radius: 12px;
-        margin-bottom: 2rem;
-        color: white !important;
-        box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-    }
-    
-    .main-header * {
-        color: white !important;
-    }
-    
-    .main-header h1 {
-        font-size: 3rem;
-        font-weight: 700;
-        margin-bottom: 0.5rem;
-        color: white !important;
-    }
-    
-    .main-header h2 {
-        font-size: 2rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-        color: white !important;
-        opacity: 0.95;
-    }
-    
-    .main-header p {
-        font-size: 1.1rem;
-        font-weight: 400;
-        color: white !important;
-        opacity: 0.95;
-    }
-    
-    /* Simplified button styling */
-    
-    /* Button styling */
-    .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        border: none;
-        border-radius: 12px;
-        padding: 0.75rem 2rem;
-        font-weight: 600;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-    }
-    
-    .stButton > button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-    }
-    
-    /* Form styling */
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea {
-        border-radius: 12px;
-        border: 2px solid #e2e8f0;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: #667eea;
-        box-shadow: 0 0 0 3px rgba(102, 126, 234, 0.1);
-    }
-    
-    /* Enhanced Sidebar Styling */
-    .css-1d391kg {
-        background: linear-gradient(180deg, #2d3748 0%, #4a5568 100%);
-        border-right: 2px solid #667eea;
-        box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1);
-    }
-    
-    /* Sidebar content */
-    .css-1d391kg .css-1y4p8pa {
-        padding: 1.5rem 1rem;
-    }
-    
-    /* Sidebar title styling */
-    .css-1d391kg h1 {
-        color: #ffffff !important;
-        font-size: 1.4rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 1.5rem !important;
-        text-align: center !important;
-        padding: 0.75rem !important;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border-radius: 8px !important;
-        box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3) !important;
-    }
-    
-    /* Navigation selectbox styling */
-    .css-1d391kg .stSelectbox > label {
-        color: #e2e8f0 !important;
-        font-weight: 500 !important;
-        font-size: 0.95rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-    
-    /* Selectbox container */
-    .css-1d391kg .stSelectbox > div > div {
-        background-color: rgba(255, 255, 255, 0.1) !important;
-        border: 1px solid rgba(255, 255, 255, 0.2) !important;
-        border-radius: 8px !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .css-1d391kg .stSelectbox > div > div:hover {
-        background-color: rgba(255, 255, 255, 0.15) !important;
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 2px rgba(102, 126, 234, 0.2) !important;
-    }
-    
-    /* Selectbox text */
-    .css-1d391kg .stSelectbox input {
-        color: #ffffff !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Dropdown arrow */
-    .css-1d391kg .stSelectbox svg {
-        fill: #e2e8f0 !important;
-    }
-    
-    /* Sidebar buttons (if any) */
-    .css-1d391kg .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 6px !important;
-        padding: 0.5rem 1rem !important;
-        font-weight: 500 !important;
-        transition: all 0.3s ease !important;
-        width: 100% !important;
-        margin: 0.25rem 0 !important;
-    }
-    
-    .css-1d391kg .stButton > button:hover {
-        transform: translateY(-1px) !important;
-        box-shadow: 0 4px 12px rgba(102, 126, 234, 0.4) !important;
-    }
-    
-    /* Sidebar text and labels */
-    .css-1d391kg p, .css-1d391kg span, .css-1d391kg div {
-        color: #e2e8f0 !important;
-    }
-    
-    /* Sidebar metrics and info boxes */
-    .css-1d391kg .metric-container {
-        background: rgba(255, 255, 255, 0.1) !important;
-        border-radius: 6px !important;
-        padding: 0.75rem !important;
-        margin: 0.5rem 0 !important;
-        border: 1px solid rgba(255, 255, 255, 0.1) !important;
-    }
-    
-    /* Sidebar markdown content */
-    .css-1d391kg .markdown-text-container {
-        color: #cbd5e0 !important;
-    }
-    
-    /* Alternative sidebar class names (Streamlit versions vary) */
-    .css-17eq0hr, .css-1lcbmhc, .css-1y4p8pa {
-        background: linear-gradient(180deg, #2d3748 0%, #4a5568 100%) !important;
-    }
-    
-    /* Additional sidebar styling for different Streamlit versions */
-    section[data-testid="stSidebar"] {
-        background: linear-gradient(180deg, #2d3748 0%, #4a5568 100%) !important;
-        border-right: 2px solid #667eea !important;
-        box-shadow: 2px 0 10px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    section[data-testid="stSidebar"] > div {
-        background: transparent !important;
-        padding-top: 2rem !important;
-    }
-    
-    /* Sidebar navigation title with enhanced styling */
-    section[data-testid="stSidebar"] h1 {
-        color: #ffffff !important;
-        font-size: 1.4rem !important;
-        font-weight: 600 !important;
-        margin-bottom: 1.5rem !important;
-        text-align: center !important;
-        padding: 0.75rem !important;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        border-radius: 8px !important;
-        box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3) !important;
-        margin-left: 0.5rem !important;
-        margin-right: 0.5rem !important;
-    }
-    
-    /* Sidebar selectbox improvements */
-    section[data-testid="stSidebar"] .stSelectbox label {
-        color: #e2e8f0 !important;
-        font-weight: 500 !important;
-        font-size: 0.95rem !important;
-        margin-bottom: 0.75rem !important;
-        letter-spacing: 0.025em !important;
-    }
-    
-    section[data-testid="stSidebar"] .stSelectbox > div > div {
-        background: rgba(255, 255, 255, 0.12) !important;
-        border: 1px solid rgba(255, 255, 255, 0.25) !important;
-        border-radius: 8px !important;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        backdrop-filter: blur(10px) !important;
-    }
-    
-    section[data-testid="stSidebar"] .stSelectbox > div > div:hover {
-        background: rgba(255, 255, 255, 0.18) !important;
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 2px rgba(102, 126, 234, 0.25), 0 4px 8px rgba(0, 0, 0, 0.1) !important;
-        transform: translateY(-1px) !important;
-    }
-    
-    /* Sidebar selectbox text */
-    section[data-testid="stSidebar"] .stSelectbox input {
-        color: #ffffff !important;
-        font-weight: 500 !important;
-        font-size: 0.95rem !important;
-    }
-    
-    /* Sidebar selectbox dropdown arrow */
-    section[data-testid="stSidebar"] .stSelectbox svg {
-        fill: #e2e8f0 !important;
-        transition: fill 0.2s ease !important;
-    }
-    
-    section[data-testid="stSidebar"] .stSelectbox:hover svg {
-        fill: #ffffff !important;
-    }
-    
-    /* Enhanced hover effects and visual feedback */
-    section[data-testid="stSidebar"] .stSelectbox {
-        transition: all 0.2s ease !important;
-    }
-    
-    section[data-testid="stSidebar"] .stSelectbox:hover {
-        transform: translateX(2px) !important;
-    }
-    
-    /* Sidebar general text styling */
-    section[data-testid="stSidebar"] p, 
-    section[data-testid="stSidebar"] span, 
-    section[data-testid="stSidebar"] div {
-        color: #e2e8f0 !important;
-    }
-    
-    /* Sidebar buttons styling */
-    section[data-testid="stSidebar"] .stButton > button {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-        color: white !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.6rem 1.2rem !important;
-        font-weight: 500 !important;
-        font-size: 0.9rem !important;
-        transition: all 0.3s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        width: 100% !important;
-        margin: 0.5rem 0 !important;
-        box-shadow: 0 2px 4px rgba(0, 0, 0, 0.1) !important;
-    }
-    
-    section[data-testid="stSidebar"] .stButton > button:hover {
-        transform: translateY(-2px) translateX(2px) !important;
-        box-shadow: 0 6px 16px rgba(102, 126, 234, 0.4) !important;
-        background: linear-gradient(135deg, #5a67d8 0%, #6b46c1 100%) !important;
-    }
-    
-    section[data-testid="stSidebar"] .stButton > button:active {
-        transform: translateY(0px) !important;
-        box-shadow: 0 2px 8px rgba(102, 126, 234, 0.3) !important;
-    }
-    
-    /* Sidebar metrics and info styling */
-    section[data-testid="stSidebar"] .metric-container,
-    section[data-testid="stSidebar"] .stMetric {
-        background: rgba(255, 255, 255, 0.08) !important;
-        border-radius: 8px !important;
-        padding: 0.75rem !important;
-        margin: 0.5rem 0 !important;
-        border: 1px solid rgba(255, 255, 255, 0.12) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    section[data-testid="stSidebar"] .metric-container:hover,
-    section[data-testid="stSidebar"] .stMetric:hover {
-        background: rgba(255, 255, 255, 0.12) !important;
-        border-color: rgba(102, 126, 234, 0.3) !important;
-        transform: translateY(-1px) !important;
-    }
-    
-    /* Sidebar markdown and text content */
-    section[data-testid="stSidebar"] .markdown-text-container {
-        color: #cbd5e0 !important;
-        line-height: 1.6 !important;
-    }
-    
-    /* Sidebar dividers */
-    section[data-testid="stSidebar"] hr {
-        border: none !important;
-        height: 1px !important;
-        background: linear-gradient(90deg, transparent 0%, rgba(255, 255, 255, 0.2) 50%, transparent 100%) !important;
-        margin: 1.5rem 0 !important;
-    }
-    
-    /* Visual hierarchy improvements */
-    section[data-testid="stSidebar"] h2, 
-    section[data-testid="stSidebar"] h3 {
-        color: #ffffff !important;
-        font-weight: 600 !important;
-        margin-top: 1.5rem !important;
-        margin-bottom: 0.75rem !important;
-        padding-bottom: 0.5rem !important;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.15) !important;
-    }
-    
-    /* Sidebar icon enhancements */
-    section[data-testid="stSidebar"] .stSelectbox::before {
-        content: "🧭" !important;
-        margin-right: 0.5rem !important;
-        font-size: 1.1rem !important;
-    }
-    
-    /* Navigation section styling */
-    section[data-testid="stSidebar"] > div:first-child {
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1) !important;
-        padding-bottom: 1rem !important;
-        margin-bottom: 1rem !important;
-    }
-    
-    /* Sidebar scrollbar styling */
-    section[data-testid="stSidebar"]::-webkit-scrollbar {
-        width: 6px !important;
-    }
-    
-    section[data-testid="stSidebar"]::-webkit-scrollbar-track {
-        background: rgba(255, 255, 255, 0.1) !important;
-        border-radius: 3px !important;
-    }
-    
-    section[data-testid="stSidebar"]::-webkit-scrollbar-thumb {
-        background: rgba(102, 126, 234, 0.5) !important;
-        border-radius: 3px !important;
-        transition: background 0.3s ease !important;
-    }
-    
-    section[data-testid="stSidebar"]::-webkit-scrollbar-thumb:hover {
-        background: rgba(102, 126, 234, 0.7) !important;
-    }
-    
-    /* Responsive sidebar adjustments */
-    @media (max-width: 768px) {
-        section[data-testid="stSidebar"] {
-            box-shadow: 0 0 20px rgba(0, 0, 0, 0.2) !important;
-        }
-        
-        section[data-testid="stSidebar"] h1 {
-            font-size: 1.2rem !important;
-            padding: 0.5rem !important;
-        }
-    }
-    
-    /* Polish for selected state */
-    section[data-testid="stSidebar"] .stSelectbox > div > div[aria-expanded="true"] {
-        background: rgba(102, 126, 234, 0.2) !important;
-        border-color: #667eea !important;
-        box-shadow: 0 0 0 2px rgba(102, 126, 234, 0.3) !important;
-    }
-    
-    /* Animation for loading states */
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.7; }
-    }
-    
-    .loading {
-        animation: pulse 2s infinite;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(_load_css(), unsafe_allow_html=True)
 
 # Backend API configuration
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
+# (connect, read) seconds, so a stuck backend can't block the page forever
+API_TIMEOUT = (3, 30)
 
-def import_backend_decision_engine():
-    """Helper function to import the backend decision engine with proper path setup"""
+@st.cache_resource(show_spinner=False)
+def _find_root():
+    """Walk up once from this file to the directory `src.backend` is importable from"""
+    here = Path(__file__).resolve().parent
+    for parent in (here, *here.parents):
+        if (parent / "src" / "backend" / "__init__.py").exists() or (parent / "pyproject.toml").exists():
+            return str(parent)
+    return None
+
+_WORKING_ROOT = _find_root()
+
+@st.cache_resource(show_spinner=False)
+def _import_decision_engine_module():
+    """
+    Import the decision engine module from the project root once per server process.
+    
+    Cached functions must not write to the page, so problems are returned as an
+    error_info dict for import_backend_decision_engine to render.
+    
+    Returns:
+        Tuple of (module or None, error_info dict or None)
+    """
+    if _WORKING_ROOT is None:
+        return None, {
+            'kind': 'backend_not_found',
+            'debug_info': {
+                'frontend_dir': os.path.dirname(os.path.abspath(__file__)),
+                'cwd': os.getcwd()
+            }
+        }
+    
+    # Add working root to sys.path if not already there
+    if _WORKING_ROOT not in sys.path:
+        sys.path.insert(0, _WORKING_ROOT)
+    
     try:
-        import sys
-        import os
-        
-        # Get the current file's directory (frontend folder)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        # Go up one level to get project root
-        project_root = os.path.dirname(current_dir)
-        
-        # Debug information
-        debug_info = {
-            'current_dir': current_dir,
-            'project_root': project_root,
-            'backend_exists': os.path.exists(os.path.join(project_root, 'backend')),
-            'init_exists': os.path.exists(os.path.join(project_root, 'backend', '__init__.py')),
-            'engine_exists': os.path.exists(os.path.join(project_root, 'backend', 'enhanced_decision_engine.py')),
+        import src.backend.compliance.enhanced_decision_engine as edm
+        return edm, None
+    except ImportError as e:
+        return None, {
+            'kind': 'import_error',
+            'error': str(e),
             'cwd': os.getcwd(),
-            'project_in_path': project_root in sys.path
+            'working_root': _WORKING_ROOT,
+            'sys_path': sys.path[:5]
         }
-        
-        # Try multiple potential project roots
-        potential_roots = [
-            project_root,  # Standard: one level up from frontend
-            os.getcwd(),   # Current working directory
-            os.path.dirname(os.getcwd()),  # One level up from CWD
-            '/'.join(current_dir.split('/')[:-1]),  # Alternative path calculation
-        ]
-        
-        backend_found = False
-        working_root = None
-        
-        for root in potential_roots:
-            if os.path.exists(os.path.join(root, 'backend', '__init__.py')):
-                working_root = root
-                backend_found = True
-                break
-        
-        if not backend_found:
-            st.error("❌ Could not locate backend directory with __init__.py")
-            if st.checkbox("Show Debug Info", key="debug_backend_search"):
-                st.json(debug_info)
-                st.write("**Potential roots checked:**")
-                for i, root in enumerate(potential_roots):
-                    backend_path = os.path.join(root, 'backend')
-                    st.write(f"{i+1}. `{root}` → backend exists: {os.path.exists(backend_path)}")
-            return None
-        
-        # Add working root to sys.path if not already there
-        if working_root not in sys.path:
-            sys.path.insert(0, working_root)
-        
-        # Try importing the backend module
-        from src.backend.compliance.enhanced_decision_engine import EnhancedDecisionEngine
-        return EnhancedDecisionEngine()
-        
-    except ImportError as first_import_error:
-        # Fallback: Try simpler import with current directory
-        try:
-            import sys
-            import os
-            
-            # Simple fallback: Add current directory to path
-            current_cwd = os.getcwd()
-            if current_cwd not in sys.path:
-                sys.path.insert(0, current_cwd)
-                
-            from src.backend.compliance.enhanced_decision_engine import EnhancedDecisionEngine
-            return EnhancedDecisionEngine()
-            
-        except ImportError:
-            # Both methods failed, show detailed error
-            st.error(f"❌ Could not import backend module: {first_import_error}")
-            st.info("💡 Make sure you're running the app from the project root directory with: `streamlit run frontend/app.py`")
-            
-            if st.checkbox("Show Detailed Debug Info", key="debug_import_error"):
-                st.write("**Debug Information:**")
-                st.write(f"- Current working directory: {os.getcwd()}")
-                st.write(f"- Frontend file location: {current_dir}")
-                st.write(f"- Calculated project root: {working_root}")
-                st.write(f"- Backend directory exists: {os.path.exists(os.path.join(working_root or project_root, 'backend'))}")
-                st.write(f"- Backend __init__.py exists: {os.path.exists(os.path.join(working_root or project_root, 'backend', '__init__.py'))}")
-                st.write("**Python path (first 5 entries):**")
-                for i, path in enumerate(sys.path[:5]):
-                    st.write(f"  {i}: {path}")
-            
-            return None
     except Exception as e:
+        return None, {'kind': 'error', 'error': str(e), 'error_type': type(e).__name__}
+
+# Resolved once per process; later reruns hit the resource cache
+_edm, _EDM_IMPORT_ERROR = _import_decision_engine_module()
+
+def import_backend_decision_engine():
+    """Helper function to get this session's decision engine, showing any setup errors"""
+    if _edm is not None:
+        if "engine" not in st.session_state:
+            try:
+                st.session_state.engine = _edm.EnhancedDecisionEngine()
+            except Exception as e:
+                st.error(f"❌ Error setting up decision engine: {e}")
+                st.write(f"Error type: {type(e).__name__}")
+                return None
+        return st.session_state.engine
+    
+    # Don't keep a failed lookup cached; retry on the next rerun
+    _find_root.clear()
+    _import_decision_engine_module.clear()
+    
+    error_info = _EDM_IMPORT_ERROR
+    if error_info['kind'] == 'backend_not_found':
+        st.error("❌ Could not locate the project root containing src/backend/__init__.py")
+        if st.checkbox("Show Debug Info", key="debug_backend_search"):
+            st.json(error_info['debug_info'])
+    elif error_info['kind'] == 'import_error':
+        st.error(f"❌ Could not import backend module: {error_info['error']}")
+        st.info("💡 Make sure you're running the app from the project root directory with: `streamlit run src/frontend/app.py`")
+        
+        if st.checkbox("Show Detailed Debug Info", key="debug_import_error"):
+            st.write("**Debug Information:**")
+            st.write(f"- Current working directory: {error_info['cwd']}")
+            st.write(f"- Project root: {error_info['working_root']}")
+            st.write("**Python path (first 5 entries):**")
+            for i, path in enumerate(error_info['sys_path']):
+                st.write(f"  {i}: {path}")
+    else:
         # General error handling
-        st.error(f"❌ Error setting up decision engine: {e}")
-        st.write(f"Error type: {type(e).__name__}")
-        return None
+        st.error(f"❌ Error setting up decision engine: {error_info['error']}")
+        st.write(f"Error type: {error_info['error_type']}")
+    return None
 
-def call_api(endpoint: str, data=None, files=None, headers=None):
-    """Make API calls to the backend"""
+@st.cache_resource(show_spinner=False)
+def _backend_breaker() -> dict:
+    """Process-wide record of when the backend may next be contacted after a connection failure"""
+    return {"until": 0.0}
+
+_BREAKER = _backend_breaker()
+_BREAKER_COOLDOWN = 10
+
+def _backend_down() -> bool:
+    """Short-circuit backend calls while the breaker is open, showing why"""
+    remaining = _BREAKER["until"] - time.monotonic()
+    if remaining <= 0:
+        return False
+    st.error(f"❌ Backend unreachable; retrying in {remaining:.0f}s")
+    return True
+
+def _show_api_error(error: requests.exceptions.RequestException):
+    """Render a failed backend call"""
+    if isinstance(error, requests.exceptions.ConnectionError):
+        # Fail fast instead of waiting on connect timeouts every rerun
+        _BREAKER["until"] = time.monotonic() + _BREAKER_COOLDOWN
+        st.error("❌ Cannot connect to backend API. Make sure the FastAPI server is running on http://localhost:8000")
+        st.info("💡 Run: `uvicorn backend.main:app --reload`")
+    else:
+        st.error(f"❌ API Error: {error}")
+
+# Kept-alive connections per backend host, enough for every concurrent batch worker
+_POOL_MAXSIZE = 8
+
+@st.cache_resource(show_spinner=False)
+def _session() -> requests.Session:
+    """Shared HTTP session that keeps backend connections alive between calls"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+def _post_api(endpoint: str, data=None, files=None, headers=None):
+    """Make uncached POST calls to the backend, returning the decoded JSON body or None on error"""
+    if _backend_down():
+        return None
     try:
         url = f"{API_BASE_URL}{endpoint}"
         
@@ -564,95 +196,88 @@ def call_api(endpoint: str, data=None, files=None, headers=None):
             headers = {}
         
         if files:
-            response = requests.post(url, files=files, headers=headers)
-        elif data:
-            response = requests.post(url, json=data, headers=headers)
+            response = _session().post(url, files=files, headers=headers, timeout=API_TIMEOUT)
         else:
-            response = requests.get(url, headers=headers)
+            response = _session().post(url, json=data, headers=headers, timeout=API_TIMEOUT)
         
         response.raise_for_status()
-        return response
-    except requests.exceptions.ConnectionError:
-        st.error("❌ Cannot connect to backend API. Make sure the FastAPI server is running on http://localhost:8000")
-        st.info("💡 Run: `uvicorn backend.main:app --reload`")
+        return _json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        _show_api_error(e)
         return None
+
+def _get_json(endpoint: str, headers=None, params=None) -> dict:
+    """
+    Uncached GET of a backend endpoint, for the st.cache_data fetch helpers.
+    
+    Raises:
+        requests.exceptions.RequestException: If the backend call fails
+    """
+    response = _session().get(f"{API_BASE_URL}{endpoint}", headers=headers, params=params, timeout=API_TIMEOUT)
+    response.raise_for_status()
+    return _json_loads(response.content)
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _get_api_json(endpoint: str, headers_key: tuple = (), params_key: tuple = ()) -> dict:
+    """
+    GET a backend endpoint and cache the decoded JSON for 60 seconds.
+    
+    Args:
+        endpoint: API path
+        headers_key: Request headers as a sorted tuple of items, so it can be hashed
+        params_key: Query parameters as a sorted tuple of items, so it can be hashed
+        
+    Returns:
+        Decoded JSON body; errors are raised and therefore never cached
+    """
+    return _get_json(endpoint, dict(headers_key), dict(params_key))
+
+def _cached_call(fetch, *args):
+    """Call a cached fetch helper, rendering the error and returning None if the backend call fails"""
+    if _backend_down():
+        return None
+    try:
+        return fetch(*args)
     except requests.exceptions.RequestException as e:
-        st.error(f"❌ API Error: {e}")
+        _show_api_error(e)
         return None
 
+def get_api_json(endpoint: str, headers=None, params=None):
+    """Make cached GET calls to the backend, returning the JSON body or None on error"""
+    return _cached_call(
+        _get_api_json, endpoint, tuple(sorted((headers or {}).items())), tuple(sorted((params or {}).items()))
+    )
 
+# Wrapper opened and closed around result sections
+_RESULTS_OPEN = '<div class="results-container">'
+_RESULTS_CLOSE = '</div>'
 
-def display_detailed_confidence_breakdown(result: dict):
-    """Display detailed confidence breakdown with visual indicators and explanations"""
-    
-    confidence_breakdown = result.get('confidence_breakdown', {})
-    standardized_entities = result.get('standardized_entities', {})
-    
-    # Overall confidence for reference
-    overall_confidence = result.get('overall_confidence', result.get('confidence', 0))
-    primary_confidence = result.get('primary_confidence', 0)
-    secondary_confidence = result.get('secondary_confidence', 0)
-    
-    st.subheader("🎯 Confidence Explainability")
-    st.markdown("**Detailed breakdown of analysis confidence across different components:**")
-    
-    # Entity Detection Component
-    entity_confidence_scores = standardized_entities.get('confidence_scores', {})
-    entity_avg = sum(entity_confidence_scores.values()) / len(entity_confidence_scores) if entity_confidence_scores else 0.5
-    entity_percentage = entity_avg * 100
-    
-    if entity_percentage >= 85:
-        entity_icon = "✅"
-        entity_status = "High Confidence"
-    elif entity_percentage >= 60:
-        entity_icon = "⚠️"
-        entity_status = "Medium Confidence"
-    else:
-        entity_icon = "❌"
-        entity_status = "Low Confidence"
-    
-    st.markdown(f"**Entity Detection {entity_icon} ({entity_percentage:.0f}%)** - {entity_status}")
-    
-    # Classification Component
-    classification_percentage = primary_confidence * 100
-    
-    if classification_percentage >= 85:
-        classification_icon = "✅"
-        classification_status = "High Confidence"
-    elif classification_percentage >= 60:
-        classification_icon = "⚠️"
-        classification_status = "Medium Confidence"
-    else:
-        classification_icon = "❌"
-        classification_status = "Low Confidence"
-    
-    st.markdown(f"**Classification {classification_icon} ({classification_percentage:.0f}%)** - {classification_status}")
-    
-    # Law Matching Component
-    law_matching_percentage = secondary_confidence * 100
-    
-    if law_matching_percentage >= 85:
-        law_icon = "✅"
-        law_status = "High Confidence"
-    elif law_matching_percentage >= 60:
-        law_icon = "⚠️"
-        law_status = "Medium Confidence"
-    else:
-        law_icon = "❌"
-        law_status = "Low Confidence"
-    
-    st.markdown(f"**Law Matching {law_icon} ({law_matching_percentage:.0f}%)** - {law_status}")
-    
-    # Progress bars for visual representation
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.progress(entity_avg)
-    with col2:
-        st.progress(primary_confidence)
-    with col3:
-        st.progress(secondary_confidence)
-    
-    # Explanations for low confidence scores
+# Confidence tiers as (minimum percentage, icon, label), highest first
+_TIERS = (
+    (85, "✅", "High Confidence"),
+    (60, "⚠️", "Medium Confidence"),
+    (0, "❌", "Low Confidence"),
+)
+
+def _tier(pct: float):
+    """Return the (icon, label) of the confidence tier a percentage falls in"""
+    for threshold, icon, label in _TIERS:
+        if pct >= threshold:
+            return icon, label
+    return _TIERS[-1][1:]
+
+def _iter_regions(locations):
+    """Yield every region named by a list of detected locations"""
+    for loc in locations:
+        region = loc.get('region')
+        if region is None:
+            continue
+        yield from (region if isinstance(region, list) else (region,))
+
+def _build_explanations(result: dict, standardized_entities: dict, entity_percentage: float,
+                        classification_percentage: float, law_matching_percentage: float,
+                        entity_confidence_scores: dict) -> list:
+    """Explain each confidence component that falls below the high-confidence tier"""
     explanations = []
     
     # Entity detection explanations
@@ -684,81 +309,256 @@ def display_detailed_confidence_breakdown(result: dict):
             explanations.append("⚖️ **Law Matching**: No specific regulations matched to this feature type.")
         elif law_matching_percentage < 60:
             # Look for mismatches in the standardized entities vs regulations
-            detected_jurisdictions = []
-            for loc in standardized_entities.get('locations', []):
-                region = loc.get('region', [])
-                if isinstance(region, list):
-                    detected_jurisdictions.extend(region)
-                elif isinstance(region, str):
-                    detected_jurisdictions.append(region)
-            
-            reg_jurisdictions = [reg.get('jurisdiction', '') for reg in applicable_regulations]
+            dj_low = {
+                dj.lower() for dj in _iter_regions(standardized_entities.get('locations', []))
+                if isinstance(dj, str)
+            }
+            rj_low = {
+                rj.lower() for rj in (reg.get('jurisdiction', '') for reg in applicable_regulations)
+                if isinstance(rj, str)
+            }
             
-            if detected_jurisdictions and reg_jurisdictions:
-                # Check for overlap between detected and regulation jurisdictions
-                jurisdiction_overlap = any(
-                    any(dj.lower() in rj.lower() or rj.lower() in dj.lower() 
-                        for dj in detected_jurisdictions if isinstance(dj, str))
-                    for rj in reg_jurisdictions if isinstance(rj, str)
+            if dj_low and rj_low:
+                # Check for overlap between detected and regulation jurisdictions:
+                # exact matches first, then substring matches either way
+                jurisdiction_overlap = bool(dj_low & rj_low) or any(
+                    dj in rj or rj in dj for dj in dj_low for rj in rj_low
                 )
                 if not jurisdiction_overlap:
                     explanations.append("🌍 **Jurisdiction Mismatch**: Feature mentions specific locations but regulations apply to different jurisdictions.")
             
             detected_ages = standardized_entities.get('ages', [])
             if detected_ages:
-                age_regs = [reg for reg in applicable_regulations if 'minor' in reg.get('name', '').lower() or 'child' in reg.get('name', '').lower()]
-                if detected_ages and not age_regs:
+                has_age_reg = next(
+                    (True for reg in applicable_regulations
+                     if 'minor' in reg.get('name', '').lower() or 'child' in reg.get('name', '').lower()),
+                    False
+                )
+                if not has_age_reg:
                     explanations.append("👶 **Age Regulation Gap**: Feature mentions age groups but no age-specific regulations identified.")
         else:
             explanations.append("📋 **Regulation Confidence**: Some applicable laws identified but uncertain about enforcement requirements.")
     
-    # Display explanations
-    if explanations:
-        st.markdown("**🔍 Confidence Explanations:**")
-        for explanation in explanations:
-            st.info(explanation)
+    return explanations
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _cached_threshold_summary(version: str, _engine) -> dict:
+    """
+    Threshold summary shared across reruns and sessions.
+    
+    Each category also gets a 'short_description' truncated for the threshold
+    table, so the truncation happens once per config rather than per render.
+    
+    Args:
+        version: The engine's config_version; the cache key, so edited thresholds show up
+        _engine: Engine to read the summary from (not hashed by Streamlit)
+    """
+    return {
+        name: {
+            **config,
+            "short_description": (config["description"][:50] + "...")
+            if len(config["description"]) > 50 else config["description"]
+        }
+        for name, config in _engine.get_threshold_summary().items()
+    }
+
+def _rule_name(rule) -> str:
+    """Display string of an escalation rule, which may be an enum or a plain string"""
+    return rule.value if hasattr(rule, 'value') else str(rule)
+
+def _display_artifacts(result: dict) -> dict:
+    """
+    Values derived from a result that several display_* functions need.
+    
+    Kept in st.session_state under a hash of the result, so the four display
+    functions of one render (and reruns showing the same result) share them.
+    """
+    key = hashlib.blake2b(_json_dumps(result), digest_size=8).hexdigest()
+    if st.session_state.get('_display_key') != key:
+        risk_assessment = result.get('risk_assessment', 'low').lower()
+        rule_name = _rule_name(result['escalation_rule']) if result.get('escalation_rule') else ''
+        st.session_state['_display_cache'] = {
+            'confidence': result.get('overall_confidence', result.get('confidence', 0)),
+            'risk_assessment': risk_assessment,
+            'risk_emoji': _RISK_ICONS.get(risk_assessment, '⚪'),
+            'rule_name': rule_name,
+            'rule_lower': rule_name.lower(),
+        }
+        st.session_state['_display_key'] = key
+    return st.session_state['_display_cache']
+
+def display_detailed_confidence_breakdown(result: dict, artifacts: dict = None):
+    """Display detailed confidence breakdown with visual indicators and explanations"""
+    
+    artifacts = artifacts or _display_artifacts(result)
+    confidence_breakdown = result.get('confidence_breakdown', {})
+    standardized_entities = result.get('standardized_entities', {})
+    
+    primary_confidence = result.get('primary_confidence', 0)
+    secondary_confidence = result.get('secondary_confidence', 0)
+    
+    # The whole section is assembled here and rendered with a single st.markdown
+    sections = [
+        "### 🎯 Confidence Explainability",
+        "**Detailed breakdown of analysis confidence across different components:**"
+    ]
+    
+    # Entity Detection Component
+    entity_confidence_scores = standardized_entities.get('confidence_scores', {})
+    entity_avg = sum(entity_confidence_scores.values()) / len(entity_confidence_scores) if entity_confidence_scores else 0.5
+    entity_percentage = int(entity_avg * 100)
+    
+    # Classification Component
+    classification_percentage = int(primary_confidence * 100)
+    
+    # Law Matching Component
+    law_matching_percentage = int(secondary_confidence * 100)
+    
+    # Labels and progress bars for all three components in a single element
+    components = (
+        ("Entity Detection", entity_avg, entity_percentage),
+        ("Classification", primary_confidence, classification_percentage),
+        ("Law Matching", secondary_confidence, law_matching_percentage),
+    )
+    cells = []
+    for name, score, pct in components:
+        icon, status = _tier(pct)
+        cells.append(
+            f'<div class="conf-cell"><strong>{name} {icon} ({pct}%)</strong> - {status}'
+            f'<progress value="{min(max(score, 0.0), 1.0):.3f}" max="1"></progress></div>'
+        )
+    sections.append(f'<div class="conf-row">{"".join(cells)}</div>')
+    
+    # Explanations for low confidence scores, skipped entirely when every
+    # component is high confidence
+    need_explain = min(entity_percentage, classification_percentage, law_matching_percentage) < 85
+    if need_explain:
+        explanations = _build_explanations(
+            result, standardized_entities, entity_percentage,
+            classification_percentage, law_matching_percentage, entity_confidence_scores
+        )
+        if explanations:
+            sections.append("**🔍 Confidence Explanations:**")
+            sections.extend(f"> ℹ️ {e}" for e in explanations)
+    
+    st.markdown("\n\n".join(sections), unsafe_allow_html=True)
     
     # Technical details in expander
     with st.expander("🔧 Technical Confidence Details"):
+        details = []
         if confidence_breakdown:
-            st.markdown("**Confidence Breakdown:**")
-            for key, value in confidence_breakdown.items():
-                if isinstance(value, (int, float)):
-                    st.markdown(f"• **{key.replace('_', ' ').title()}**: {value:.3f}")
+            details.append("**Confidence Breakdown:**")
+            details.extend(
+                f"• **{key.replace('_', ' ').title()}**: {value:.3f}"
+                for key, value in confidence_breakdown.items()
+                if isinstance(value, (int, float))
+            )
         
         if entity_confidence_scores:
-            st.markdown("**Entity Detection Scores:**")
-            for entity_type, score in entity_confidence_scores.items():
-                st.markdown(f"• **{entity_type.title()}**: {score:.3f}")
+            details.append("**Entity Detection Scores:**")
+            details.extend(
+                f"• **{entity_type.title()}**: {score:.3f}"
+                for entity_type, score in entity_confidence_scores.items()
+            )
         
         # Enhanced threshold system details
         if result.get('categories_detected') or result.get('enhanced_decision_result'):
-            st.markdown("**🎯 Enhanced Threshold Details:**")
+            details.append("**🎯 Enhanced Threshold Details:**")
             if result.get('categories_detected'):
-                st.markdown(f"• **Categories**: {', '.join(result['categories_detected'])}")
+                details.append(f"• **Categories**: {', '.join(result['categories_detected'])}")
             if result.get('applicable_threshold'):
-                st.markdown(f"• **Threshold Applied**: {result['applicable_threshold']:.3f}")
-            if result.get('escalation_rule'):
-                rule = result['escalation_rule']
-                rule_str = rule.value if hasattr(rule, 'value') else str(rule)
-                st.markdown(f"• **Escalation Rule**: {rule_str}")
+                details.append(f"• **Threshold Applied**: {result['applicable_threshold']:.3f}")
+            if artifacts['rule_name']:
+                details.append(f"• **Escalation Rule**: {artifacts['rule_name']}")
+        
+        if details:
+            st.markdown("\n\n".join(details))
 
 
-def display_enhanced_threshold_results(result: dict):
+def display_enhanced_threshold_results(result: dict, artifacts: dict = None):
     """Display enhanced threshold system results"""
     # This function is called from display_compliance_analysis
     # The actual display logic is now inline in the main function
     pass
 
-def display_all_threshold_values(result: dict):
+@st.cache_resource(show_spinner=False)
+def _title_case_cache() -> dict:
+    """Process-wide memo of snake_case names to display titles"""
+    return {}
+
+_TITLE_CASE_CACHE = _title_case_cache()
+
+def _titleify(name: str) -> str:
+    """Display form of a snake_case category or rule name, e.g. 'legal_compliance' -> 'Legal Compliance'"""
+    title = _TITLE_CASE_CACHE.get(name)
+    if title is None:
+        title = _TITLE_CASE_CACHE[name] = name.replace('_', ' ').title()
+    return title
+
+# Threshold table status label and code by (applies to feature, meets threshold);
+# the code indexes _STATUS_STYLES
+_STATUS = {
+    (True, True): ("✅ PASS", 1),
+    (True, False): ("❌ FAIL", 2),
+    (False, None): ("➖ N/A", 0),
+}
+
+_STATUS_STYLES = np.array(["color: gray", "color: green", "color: red"], dtype=object)
+
+_THRESHOLD_COLUMNS = ("Category", "Threshold", "Escalation", "Applies", "Status", "Description", "_status_code")
+
+def _row(category_name: str, threshold_val: float, escalation_rule: str, description: str,
+         applies_to_feature: bool, current_confidence: float) -> tuple:
+    """Build one row of the system threshold table, in _THRESHOLD_COLUMNS order"""
+    meets_threshold = current_confidence >= threshold_val if applies_to_feature else None
+    status, status_code = _STATUS[(applies_to_feature, meets_threshold)]
+    return (
+        _titleify(category_name),
+        f"{threshold_val:.1%}",
+        _titleify(escalation_rule),
+        "🎯" if applies_to_feature else "➖",
+        status,
+        description,
+        status_code
+    )
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _threshold_table_frames(threshold_rows: tuple):
+    """
+    Threshold table and its cell style matrix for a tuple of _row tuples.
+    
+    Both are plain DataFrames, so st.cache_data can pickle them and every
+    session gets its own copy; the Styler wrapping them is built per render.
+    """
+    df = pd.DataFrame(list(threshold_rows), columns=list(_THRESHOLD_COLUMNS))
+    
+    # Color each row by its status with one precomputed style matrix, then drop the helper column
+    row_styles = _STATUS_STYLES[df.pop("_status_code").to_numpy()]
+    style_mat = pd.DataFrame(
+        np.broadcast_to(row_styles[:, None], df.shape), index=df.index, columns=df.columns
+    )
+    return df, style_mat
+
+def _build_threshold_table(threshold_rows: tuple):
+    """
+    Build the styled threshold table for a tuple of _row tuples.
+    
+    st.dataframe computes and mutates the Styler it renders, so a fresh one
+    is made for every call around the cached frames.
+    """
+    df, style_mat = _threshold_table_frames(threshold_rows)
+    return df.style.apply(lambda _: style_mat, axis=None)
+
+def display_all_threshold_values(result: dict, artifacts: dict = None):
     """Display comprehensive threshold overview showing all system thresholds"""
     
+    artifacts = artifacts or _display_artifacts(result)
     st.markdown("### 🎯 **System Threshold Overview**")
     
     # Load threshold configuration
     engine = import_backend_decision_engine()
     if engine:
-        threshold_summary = engine.get_threshold_summary()
+        threshold_summary = _cached_threshold_summary(engine.config_version, engine)
         
         # Get current feature's information
         current_confidence = result.get('overall_confidence', 0)
@@ -768,57 +568,19 @@ def display_all_threshold_values(result: dict):
         # Create columns for threshold display
         st.markdown("**All Category Thresholds:**")
         
-        # Display in a nice table format
-        threshold_data = []
-        
-        for category_name, config in threshold_summary.items():
-            threshold_val = config['threshold']
-            escalation_rule = config['escalation']
-            description = config['description']
-            
-            # Determine if this category applies to current feature
-            applies_to_feature = category_name in categories_detected
-            meets_threshold = current_confidence >= threshold_val if applies_to_feature else None
-            
-            # Status indicators
-            if applies_to_feature:
-                if meets_threshold:
-                    status = "✅ PASS"
-                    status_color = "green"
-                else:
-                    status = "❌ FAIL"
-                    status_color = "red"
-            else:
-                status = "➖ N/A"
-                status_color = "gray"
-            
-            threshold_data.append({
-                "Category": category_name.replace('_', ' ').title(),
-                "Threshold": f"{threshold_val:.1%}",
-                "Escalation": escalation_rule.replace('_', ' ').title(),
-                "Applies": "🎯" if applies_to_feature else "➖",
-                "Status": status,
-                "Description": description[:50] + "..." if len(description) > 50 else description
-            })
-        
-        # Sort by threshold value (highest first)
-        threshold_data.sort(key=lambda x: float(x['Threshold'].rstrip('%'))/100, reverse=True)
-        
-        # Display as DataFrame for better formatting
-        import pandas as pd
-        df = pd.DataFrame(threshold_data)
-        
-        # Style the dataframe based on status
-        def style_row(row):
-            if row['Applies'] == "🎯":
-                if "PASS" in row['Status']:
-                    return ['background-color: #d4edda'] * len(row)
-                elif "FAIL" in row['Status']:
-                    return ['background-color: #f8d7da'] * len(row)
-            return [''] * len(row)
+        # Display in a nice table format, highest threshold first
+        # Rows are kept with the result's other display artifacts until the config changes
+        if artifacts.get('threshold_version') != engine.config_version:
+            cats = frozenset(categories_detected or ())
+            artifacts['threshold_data'] = tuple(
+                _row(name, c["threshold"], c["escalation"], c["short_description"], name in cats, current_confidence)
+                for name, c in sorted(threshold_summary.items(), key=lambda item: item[1]["threshold"], reverse=True)
+            )
+            artifacts['threshold_version'] = engine.config_version
+        threshold_data = artifacts['threshold_data']
         
-        styled_df = df.style.apply(style_row, axis=1)
-        st.dataframe(styled_df, use_container_width=True)
+        # Display as one Arrow-backed DataFrame element for better formatting
+        st.dataframe(_build_threshold_table(threshold_data), hide_index=True, use_container_width=True)
         
         # Current feature summary
         st.markdown("---")
@@ -866,29 +628,27 @@ def display_all_threshold_values(result: dict):
             else:
                 st.error(f"❌ **BELOW THRESHOLD**: {confidence_pct:.1f}% < {threshold_pct:.1f}%")
             
-            # Progress bar comparison
-            col_a, col_b = st.columns(2)
-            with col_a:
-                st.markdown("**Feature Confidence:**")
-                st.progress(min(current_confidence, 1.0))
-            with col_b:
-                st.markdown("**Required Threshold:**")
-                st.progress(min(applicable_threshold, 1.0))
+            # Progress bar comparison, both bars in a single element
+            st.markdown(
+                '<div class="conf-row">'
+                f'<div class="conf-cell"><strong>Feature Confidence:</strong>'
+                f'<progress value="{min(current_confidence, 1.0):.3f}" max="1"></progress></div>'
+                f'<div class="conf-cell"><strong>Required Threshold:</strong>'
+                f'<progress value="{min(applicable_threshold, 1.0):.3f}" max="1"></progress></div>'
+                '</div>',
+                unsafe_allow_html=True
+            )
         
         # Show escalation information
-        if result.get('escalation_rule'):
-            escalation_rule = result.get('escalation_rule')
-            if isinstance(escalation_rule, str):
-                rule_name = escalation_rule
-            else:
-                rule_name = escalation_rule.value if hasattr(escalation_rule, 'value') else str(escalation_rule)
+        if artifacts['rule_name']:
+            rule_name, rule_lower = artifacts['rule_name'], artifacts['rule_lower']
             
             st.markdown("**Escalation Decision:**")
-            if 'human_review' in rule_name.lower():
+            if 'human_review' in rule_lower:
                 st.warning(f"⚠️ **HUMAN REVIEW REQUIRED** - {rule_name}")
-            elif 'auto_ok' in rule_name.lower():
+            elif 'auto_ok' in rule_lower:
                 st.success(f"✅ **AUTO-APPROVED** - {rule_name}")
-            elif 'ignore' in rule_name.lower():
+            elif 'ignore' in rule_lower:
                 st.info(f"ℹ️ **IGNORED** - {rule_name}")
             else:
                 st.info(f"📋 **{rule_name}**")
@@ -915,12 +675,25 @@ def display_all_threshold_values(result: dict):
             st.markdown("**Hybrid Handling:**")
             st.info("When multiple categories apply, the system uses the **strictest (highest) threshold** to ensure compliance.")
 
+# Risk level icons; callers choose the icon for unrecognised levels
+_RISK_ICONS = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢'
+}
+
+def _utc_timestamp() -> str:
+    """Current UTC time, stamped on a result when it is received"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
 def display_compliance_analysis(result: dict, title: str, description: str):
     """Display regulatory compliance analysis with audit-ready information"""
     
     # Determine compliance status and risk assessment styling
-    risk_assessment = result.get('risk_assessment', 'low').lower()
-    confidence = result.get('overall_confidence', result.get('confidence', 0))
+    artifacts = _display_artifacts(result)
+    risk_assessment = artifacts['risk_assessment']
+    confidence = artifacts['confidence']
     
     # Main compliance status
     if result['needs_geo_logic'] is True:
@@ -937,18 +710,18 @@ def display_compliance_analysis(result: dict, title: str, description: str):
         st.warning(f"{status_emoji} {status_text}")
     
     # Display detailed confidence breakdown first
-    display_detailed_confidence_breakdown(result)
+    display_detailed_confidence_breakdown(result, artifacts)
     
     # Display enhanced threshold system results (NEW)
-    display_enhanced_threshold_results(result)
+    display_enhanced_threshold_results(result, artifacts)
     
     # Display comprehensive threshold overview
-    display_all_threshold_values(result)
+    display_all_threshold_values(result, artifacts)
     
     st.markdown("---")
     
     # Create audit-ready display container
-    st.markdown('<div class="results-container">', unsafe_allow_html=True)
+    st.markdown(_RESULTS_OPEN, unsafe_allow_html=True)
     
     # Feature Information Section
     st.subheader("📋 Feature Analysis")
@@ -956,15 +729,13 @@ def display_compliance_analysis(result: dict, title: str, description: str):
         col1, col2 = st.columns([1, 3])
         
         with col1:
-            st.markdown("**Feature:**")
-            st.markdown("**Description:**")
-            st.markdown("**Overall Confidence:**")
-            st.markdown("**Risk Assessment:**")
-            st.markdown("**Legal Reasoning:**")
+            st.markdown(
+                "**Feature:**\n\n**Description:**\n\n**Overall Confidence:**\n\n"
+                "**Risk Assessment:**\n\n**Legal Reasoning:**"
+            )
         
         with col2:
-            st.markdown(f"*{title}*")
-            st.markdown(f"*{description}*")
+            st.markdown(f"*{title}*\n\n*{description}*")
             
             # Overall confidence with progress bar
             confidence_percentage = confidence * 100 if isinstance(confidence, (int, float)) else 0
@@ -983,19 +754,8 @@ def display_compliance_analysis(result: dict, title: str, description: str):
                 else:
                     st.error(f"❌ Below threshold ({confidence_percentage:.1f}% < {threshold_percentage:.1f}%)")
             
-            # Risk assessment with appropriate styling
-            risk_colors = {
-                'critical': '🔴',
-                'high': '🟠',
-                'medium': '🟡', 
-                'low': '🟢',
-                'unknown': '⚪'
-            }
-            risk_emoji = risk_colors.get(risk_assessment, '⚪')
-            st.markdown(f"{risk_emoji} **{risk_assessment.upper()}**")
-            
-            # Legal reasoning
-            st.markdown(f"*{result['reasoning']}*")
+            # Risk assessment and legal reasoning
+            st.markdown(f"{artifacts['risk_emoji']} **{risk_assessment.upper()}**\n\n*{result['reasoning']}*")
     
     st.markdown("---")
     
@@ -1006,32 +766,28 @@ def display_compliance_analysis(result: dict, title: str, description: str):
         col_a, col_b = st.columns(2)
         
         with col_a:
-            st.markdown("**Categories Detected:**")
             if result.get('categories_detected'):
-                for category in result['categories_detected']:
-                    st.markdown(f"• {category.replace('_', ' ').title()}")
+                st.markdown("\n\n".join(
+                    ["**Categories Detected:**"]
+                    + [f"• {_titleify(category)}" for category in result['categories_detected']]
+                ))
             else:
-                st.markdown("*No specific categories detected*")
+                st.markdown("**Categories Detected:**\n\n*No specific categories detected*")
             
             if result.get('applicable_threshold'):
                 st.markdown(f"**Applicable Threshold:** {result['applicable_threshold']:.2f}")
         
         with col_b:
-            if result.get('escalation_rule'):
-                escalation_rule = result['escalation_rule']
-                if isinstance(escalation_rule, str):
-                    rule_display = escalation_rule
-                else:
-                    rule_display = escalation_rule.value if hasattr(escalation_rule, 'value') else str(escalation_rule)
-                
-                st.markdown(f"**Escalation Rule:** {rule_display}")
+            if artifacts['rule_name']:
+                st.markdown(f"**Escalation Rule:** {artifacts['rule_name']}")
                 
                 # Color code based on escalation type
-                if 'human_review' in rule_display.lower():
+                rule_lower = artifacts['rule_lower']
+                if 'human_review' in rule_lower:
                     st.warning("⚠️ Requires Human Review")
-                elif 'auto_ok' in rule_display.lower():
+                elif 'auto_ok' in rule_lower:
                     st.success("✅ Auto-Approved")
-                elif 'ignore' in rule_display.lower():
+                elif 'ignore' in rule_lower:
                     st.info("ℹ️ Ignored")
             
             if result.get('escalation_reason'):
@@ -1070,8 +826,7 @@ def display_compliance_analysis(result: dict, title: str, description: str):
     if result.get('evidence_sources'):
         st.subheader("📚 Evidence Sources")
         with st.expander("View Source Documents"):
-            for source in result['evidence_sources']:
-                st.markdown(f"• {source}")
+            st.markdown("\n\n".join(f"• {source}" for source in result['evidence_sources']))
     
     # Recommended Actions Section
     if result.get('recommended_actions'):
@@ -1083,13 +838,53 @@ def display_compliance_analysis(result: dict, title: str, description: str):
     st.subheader("📋 Audit Information")
     col_audit1, col_audit2 = st.columns(2)
     with col_audit1:
-        st.markdown(f"**Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        st.markdown(f"**System Version:** Production LLM + RAG")
+        st.markdown(
+            f"**Analysis Date:** {result.get('_analysis_timestamp') or _utc_timestamp()}\n\n"
+            "**System Version:** Production LLM + RAG"
+        )
     with col_audit2:
-        st.markdown(f"**Confidence Score:** {confidence:.2f}")
-        st.markdown(f"**Risk Level:** {risk_assessment.title()}")
+        st.markdown(f"**Confidence Score:** {confidence:.2f}\n\n**Risk Level:** {risk_assessment.title()}")
     
-    st.markdown('</div>', unsafe_allow_html=True)
+    st.markdown(_RESULTS_CLOSE, unsafe_allow_html=True)
+
+@st.cache_data(show_spinner=False)
+def _load_threshold_config() -> dict:
+    """Read threshold_config.json once; an empty config if it isn't there"""
+    try:
+        with open("threshold_config.json", "r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"thresholds": {}}
+
+@st.cache_resource(show_spinner=False)
+def _get_demo():
+    """Import run_threshold_demo from scripts/demos once per server process"""
+    demos_dir = os.path.join(_WORKING_ROOT or os.getcwd(), "scripts", "demos")
+    if demos_dir not in sys.path:
+        sys.path.append(demos_dir)
+    from threshold_demo import run_threshold_demo
+    return run_threshold_demo
+
+@st.cache_data(show_spinner=False)
+def run_threshold_demo_str() -> str:
+    """Run the threshold demo once and return everything it printed"""
+    # The demo logs its per-case detail to "logeo.demo"; a stdout handler made
+    # inside the redirect writes into the captured buffer along with its prints
+    demo_log = logging.getLogger("logeo.demo")
+    saved = demo_log.level, demo_log.propagate
+    with contextlib.redirect_stdout(io.StringIO()) as demo_stdout:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        demo_log.addHandler(handler)
+        demo_log.setLevel(logging.INFO)
+        demo_log.propagate = False
+        try:
+            _get_demo()()
+        finally:
+            demo_log.removeHandler(handler)
+            demo_log.setLevel(saved[0])
+            demo_log.propagate = saved[1]
+    return demo_stdout.getvalue()
 
 def enhanced_threshold_mode():
     """Enhanced threshold system with category-specific confidence thresholds"""
@@ -1198,9 +993,10 @@ def enhanced_threshold_mode():
                         st.warning("⚠️ **Escalation Required**")
                         st.write(f"**Reason:** {result.escalation_reason}")
                         if result.threshold_violations:
-                            st.write("**Threshold Violations:**")
-                            for violation in result.threshold_violations:
-                                st.write(f"  • {violation}")
+                            st.markdown("\n\n".join(
+                                ["**Threshold Violations:**"]
+                                + [f"• {violation}" for violation in result.threshold_violations]
+                            ))
                 else:
                     st.error("❌ Could not load the decision engine. Please check the logs above.")
     
@@ -1210,11 +1006,13 @@ def enhanced_threshold_mode():
         
         engine = import_backend_decision_engine()
         if engine:
-            summary = engine.get_threshold_summary()
+            summary = _cached_threshold_summary(engine.config_version, engine)
+            # Full config for descriptions and examples, read once for all categories
+            full_config = _load_threshold_config()
             
             # Display thresholds in a nice format
             for category, config in summary.items():
-                with st.expander(f"📊 {category.replace('_', ' ').title()}"):
+                with st.expander(f"📊 {_titleify(category)}"):
                     col1, col2, col3 = st.columns(3)
                     
                     with col1:
@@ -1226,11 +1024,6 @@ def enhanced_threshold_mode():
                             "High" if config['threshold'] >= 0.85 else 
                             "Medium" if config['threshold'] >= 0.70 else "Low")
                     
-                    # Load full config for description
-                    import json
-                    with open("threshold_config.json", "r") as f:
-                        full_config = json.load(f)
-                    
                     if category in full_config["thresholds"]:
                         st.write(f"**Description:** {full_config['thresholds'][category]['description']}")
                         st.write(f"**Examples:** {', '.join(full_config['thresholds'][category]['examples'])}")
@@ -1244,33 +1037,12 @@ def enhanced_threshold_mode():
         
         if st.button("🚀 Run Demo Examples"):
             try:
-                import sys
-                import os
-                sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-                
-                from threshold_demo import run_threshold_demo
-                
-                # Capture demo output
-                import io
-                import sys
-                
-                # Redirect stdout to capture demo output
-                old_stdout = sys.stdout
-                new_stdout = io.StringIO()
-                sys.stdout = new_stdout
-                
-                try:
-                    run_threshold_demo()
-                    demo_output = new_stdout.getvalue()
-                finally:
-                    sys.stdout = old_stdout
-                
                 # Display demo output
-                st.code(demo_output, language="text")
+                st.code(run_threshold_demo_str(), language="text")
                 
             except Exception as e:
                 st.error(f"❌ Error running demo: {e}")
-                st.info("💡 Make sure threshold_demo.py is in the project root")
+                st.info("💡 Make sure threshold_demo.py is in scripts/demos")
 
 def main():
     # Header
@@ -1289,6 +1061,9 @@ def main():
         ["Single Feature Analysis", "Batch CSV Processing", "Regulatory Coverage"]
     )
     
+    if _BREAKER["until"] > time.monotonic() and st.sidebar.button("🔄 Retry backend"):
+        _BREAKER["until"] = 0.0
+    
     if mode == "Single Feature Analysis":
         single_feature_mode()
     elif mode == "Batch CSV Processing":
@@ -1325,11 +1100,9 @@ def geo_access_mode():
                     "country": country
                 }
                 
-                response = call_api("/check_access", data=data)
-                if response and response.status_code == 200:
-                    result = response.json()
-                    
-                    st.markdown('<div class="results-container">', unsafe_allow_html=True)
+                result = _post_api("/check_access", data=data)
+                if result is not None:
+                    st.markdown(_RESULTS_OPEN, unsafe_allow_html=True)
                     
                     if result['access_granted']:
                         st.success(f"✅ **Access Granted**")
@@ -1338,27 +1111,65 @@ def geo_access_mode():
                         st.error(f"❌ **Access Denied**")
                         st.warning(f"**Reason:** {result['reason']}")
                     
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    st.markdown(_RESULTS_CLOSE, unsafe_allow_html=True)
     
     # Show recent access logs
     st.subheader("📊 Recent Access Logs")
     
     if st.button("🔄 Refresh Logs"):
+        _get_api_json.clear()
         with st.spinner("Loading access logs..."):
-            response = call_api("/logs?limit=10")
-            if response and response.status_code == 200:
-                logs_data = response.json()
+            logs_data = get_api_json("/logs", params={"limit": 10})
+            if logs_data is not None:
                 logs = logs_data.get('logs', [])
                 
                 if logs:
-                    st.markdown('<div class="results-container">', unsafe_allow_html=True)
-                    for log in logs:
-                        status_icon = "✅" if log['access_granted'] else "❌"
-                        st.write(f"{status_icon} **{log['feature_name']}** - User: {log['user_id']} - Country: {log['country']} - {log['timestamp']}")
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    # Container and log lines as one element; blank lines keep the markdown rendering inside the div
+                    st.markdown("\n\n".join([
+                        _RESULTS_OPEN,
+                        *(f"{'✅' if log['access_granted'] else '❌'} **{log['feature_name']}** - User: {log['user_id']} - Country: {log['country']} - {log['timestamp']}"
+                          for log in logs),
+                        _RESULTS_CLOSE
+                    ]), unsafe_allow_html=True)
                 else:
                     st.info("No access logs found.")
 
+def _parse_regulations(applicable_regs):
+    """Decode applicable regulations stored as a JSON string; [] if unreadable"""
+    if isinstance(applicable_regs, (bytes, str)):
+        try:
+            return _json_loads(applicable_regs)
+        except ValueError:
+            return []
+    return applicable_regs or []
+
+def _split_list(value, limit: int) -> list:
+    """First `limit` entries of a semicolon-delimited string; [] if it isn't one"""
+    if isinstance(value, str) and ';' in value:
+        return [item.strip() for item in value.split(';')[:limit]]
+    return []
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_audit(limit: int) -> list:
+    """
+    Fetch audit records with their regulations already decoded and their
+    evidence sources and actions split into '_sources' and '_actions', so each
+    API response is parsed once rather than on every rerun.
+    
+    Raises:
+        requests.exceptions.RequestException: If the backend call fails
+    """
+    data = _get_json("/compliance_audit", params={"limit": limit})
+    return [
+        {
+            **record,
+            'applicable_regulations': _parse_regulations(record.get('applicable_regulations', [])),
+            '_sources': _split_list(record.get('evidence_sources'), 3),
+            '_actions': _split_list(record.get('recommended_actions'), 2),
+        }
+        for record in data.get('audit_records', [])
+    ]
+
 def compliance_audit_mode():
     """Compliance audit interface for regulatory analysis results"""
     st.header("📋 Compliance Audit Trail")
@@ -1375,74 +1186,61 @@ def compliance_audit_mode():
     
     with col2:
         if st.button("🔄 Refresh Audit Data"):
+            _fetch_audit.clear()
             st.rerun()
     
     with st.spinner("Loading compliance audit records..."):
-        response = call_api(f"/compliance_audit?limit={limit}")
-        if response and response.status_code == 200:
-            data = response.json()
-            records = data.get('audit_records', [])
-            
+        records = _cached_call(_fetch_audit, limit)
+        
+        if records is not None:
             if records:
                 st.success(f"📈 Found {len(records)} audit records")
                 
-                st.markdown('<div class="results-container">', unsafe_allow_html=True)
+                st.markdown(_RESULTS_OPEN, unsafe_allow_html=True)
                 
                 for i, record in enumerate(records):
-                    # Parse applicable regulations if it's JSON string
-                    applicable_regs = record.get('applicable_regulations', [])
-                    if isinstance(applicable_regs, str):
-                        try:
-                            applicable_regs = json.loads(applicable_regs)
-                        except:
-                            applicable_regs = []
+                    # Unpack each record once
+                    applicable_regs = record['applicable_regulations']
+                    title = record.get('title')
+                    desc = record.get('description', 'N/A')
+                    desc_short = desc[:200] + ('...' if len(desc) > 200 else '')
+                    ts = record.get('timestamp', 'No timestamp')[:19]
+                    needs_geo = record.get('needs_geo_logic')
+                    conf = record.get('confidence', 0)
+                    risk = record.get('risk_assessment')
                     
-                    with st.expander(f"📋 {record.get('title', 'Untitled Feature')} - {record.get('timestamp', 'No timestamp')[:19]}"):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.markdown(f"**📝 Feature:** {record.get('title', 'N/A')}")
-                            st.markdown(f"**📄 Description:** {record.get('description', 'N/A')[:200]}{'...' if len(record.get('description', '')) > 200 else ''}")
-                            st.markdown(f"**⚖️ Geo-Compliance Required:** {'🚨 Yes' if record.get('needs_geo_logic') else '✅ No'}")
-                            st.markdown(f"**🎯 Confidence:** {record.get('confidence', 0):.2f}")
+                    with st.expander(f"📋 {title or 'Untitled Feature'} - {ts}"):
+                        risk_icon = _RISK_ICONS.get((risk or 'unknown').lower(), "🟢")
+                        regs = "; ".join(
+                            f"{reg.get('name', 'Unknown')} ({reg.get('jurisdiction', 'Unknown')})"
+                            if isinstance(reg, dict) else str(reg)
+                            for reg in applicable_regs[:3]  # Show first 3
+                        ) or "None detected"
                         
-                        with col2:
-                            risk_level = record.get('risk_assessment', 'unknown').lower()
-                            risk_icon = "🔴" if risk_level == "critical" else "🟠" if risk_level == "high" else "🟡" if risk_level == "medium" else "🟢"
-                            st.markdown(f"**📊 Risk Assessment:** {risk_icon} {record.get('risk_assessment', 'N/A').title()}")
-                            
-                            if applicable_regs:
-                                st.markdown("**⚖️ Applicable Regulations:**")
-                                for reg in applicable_regs[:3]:  # Show first 3
-                                    if isinstance(reg, dict):
-                                        st.markdown(f"• {reg.get('name', 'Unknown')} ({reg.get('jurisdiction', 'Unknown')})")
-                                    else:
-                                        st.markdown(f"• {reg}")
-                            else:
-                                st.markdown("**⚖️ Regulations:** None detected")
+                        # Record summary as one two-column table element
+                        st.table(pd.DataFrame({
+                            "Field": ["📝 Feature", "📄 Description", "⚖️ Geo-Compliance Required",
+                                      "🎯 Confidence", "📊 Risk Assessment", "⚖️ Applicable Regulations"],
+                            "Value": [title or 'N/A', desc_short, '🚨 Yes' if needs_geo else '✅ No',
+                                      f"{conf:.2f}", f"{risk_icon} {(risk or 'N/A').title()}", regs],
+                        }).set_index("Field"))
                         
                         # Legal reasoning
-                        st.markdown(f"**💭 Legal Reasoning:** {record.get('reasoning', 'N/A')}")
+                        lines = [f"**💭 Legal Reasoning:** {record.get('reasoning', 'N/A')}"]
+                        
+                        # Evidence sources (critical for audit), first 3 split at fetch time
+                        if record['_sources']:
+                            lines.append("**📚 Evidence Sources:**")
+                            lines.extend(f"• {source}" for source in record['_sources'])
                         
-                        # Evidence sources (critical for audit)
-                        evidence = record.get('evidence_sources', '')
-                        if evidence and evidence != 'No relevant regulatory documents found':
-                            if isinstance(evidence, str) and ';' in evidence:
-                                sources = evidence.split(';')
-                                st.markdown("**📚 Evidence Sources:**")
-                                for source in sources[:3]:  # Show first 3 sources
-                                    st.markdown(f"• {source.strip()}")
+                        # Recommended actions, first 2
+                        if record['_actions']:
+                            lines.append("**🎯 Recommended Actions:**")
+                            lines.extend(f"• {action}" for action in record['_actions'])
                         
-                        # Recommended actions
-                        actions = record.get('recommended_actions', '')
-                        if actions:
-                            if isinstance(actions, str) and ';' in actions:
-                                action_list = actions.split(';')
-                                st.markdown("**🎯 Recommended Actions:**")
-                                for action in action_list[:2]:  # Show first 2 actions
-                                    st.markdown(f"• {action.strip()}")
+                        st.markdown("\n\n".join(lines))
                 
-                st.markdown('</div>', unsafe_allow_html=True)
+                st.markdown(_RESULTS_CLOSE, unsafe_allow_html=True)
                 
             else:
                 st.info("📝 No audit records found. Run some compliance analyses first!")
@@ -1454,6 +1252,135 @@ def compliance_audit_mode():
             st.error("❌ Failed to load audit records")
             st.info("Make sure your backend is running and properly configured.")
 
+# Jurisdiction by filename prefix, or failing that by substring in order
+_JURISDICTION_MAP = {
+    'ca': '🇨🇦 Canada',
+    'eu': '🇪🇺 European Union',
+    'us': '🇺🇸 United States',
+    'fl': '🇺🇸 Florida, USA',
+    'ut': '🇺🇸 Utah, USA',
+    'ccpa': '🇺🇸 California, USA',
+    'coppa': '🇺🇸 United States (Federal)',
+    'gdpr': '🇪🇺 European Union',
+    'ncmec': '🇺🇸 United States (Federal)'
+}
+
+def _build_prefix_trie(mapping: dict) -> dict:
+    """Character trie over the mapping's keys; a '$' entry holds the value at a key's end"""
+    trie = {}
+    for prefix, value in mapping.items():
+        node = trie
+        for ch in prefix:
+            node = node.setdefault(ch, {})
+        node['$'] = value
+    return trie
+
+_JURISDICTION_TRIE = _build_prefix_trie(_JURISDICTION_MAP)
+
+# Substring fallback: every key occurrence in one scan, earliest map key wins
+_JURISDICTION_PRIORITY = {prefix: i for i, prefix in enumerate(_JURISDICTION_MAP)}
+_JURISDICTION_RE = re.compile("(?=(" + "|".join(map(re.escape, _JURISDICTION_MAP)) + "))")
+
+def _lookup_prefix(trie: dict, text: str):
+    """Value of the shortest trie key that text starts with, or None, in one pass over text"""
+    node = trie
+    for ch in text:
+        if '$' in node:
+            return node['$']
+        node = node.get(ch)
+        if node is None:
+            return None
+    return node.get('$')
+
+# Regulation type by name keyword, first match wins
+_REG_TYPES = (
+    (('child', 'minor', 'kid', 'coppa'), "👶 Child Protection"),
+    (('data', 'privacy', 'gdpr', 'ccpa'), "🔒 Data Privacy"),
+    (('dsa', 'platform', 'social'), "📱 Platform Regulation"),
+    (('reporting', 'ncmec'), "📊 Reporting Requirements"),
+)
+
+# Priority (index into _REG_TYPES) of each keyword, and one pattern that finds
+# every keyword occurrence, overlapping ones included, in a single scan
+_REG_TYPE_PRIORITY = {keyword: i for i, (keywords, _) in enumerate(_REG_TYPES) for keyword in keywords}
+_REG_TYPE_RE = re.compile("(?=(" + "|".join(map(re.escape, _REG_TYPE_PRIORITY)) + "))")
+
+# Document size description by minimum content length, largest first
+_SIZE_DESCRIPTIONS = (
+    (10001, "📚 Comprehensive Document"),
+    (5001, "📄 Standard Document"),
+    (1001, "📃 Brief Document"),
+    (0, "📝 Summary Document"),
+)
+
+def _classify_regulation(reg: dict) -> dict:
+    """Regulation with its display jurisdiction, type, size and reading time attached"""
+    name = reg.get('name', 'Unknown Regulation')
+    name_lower = name.lower()
+    filename = reg.get('filename', name_lower.replace(' ', '_')).lower()
+    content_length = reg.get('content_length', 0)
+    
+    jurisdiction = _lookup_prefix(_JURISDICTION_TRIE, filename)
+    if jurisdiction is None:
+        found = _JURISDICTION_RE.findall(filename)
+        if found:
+            jurisdiction = _JURISDICTION_MAP[min(found, key=_JURISDICTION_PRIORITY.__getitem__)]
+    priorities = [_REG_TYPE_PRIORITY[keyword] for keyword in _REG_TYPE_RE.findall(name_lower)]
+    reg_type = _REG_TYPES[min(priorities)][1] if priorities else "📋 General Compliance"
+    size_desc = next(label for minimum, label in _SIZE_DESCRIPTIONS if content_length >= minimum)
+    
+    # Approximate reading time: 5 chars per word, 200 words per minute
+    reading_time = max(1, content_length // 5 // 200)
+    
+    return {
+        **reg,
+        '_name': name,
+        '_jurisdiction': jurisdiction,
+        '_type': reg_type,
+        '_size': size_desc,
+        '_reading_time': reading_time,
+    }
+
+# Country heading by jurisdiction flag
+_COUNTRIES = {
+    '🇺🇸': '🇺🇸 United States',
+    '🇪🇺': '🇪🇺 European Union',
+    '🇨🇦': '🇨🇦 Canada',
+}
+
+def _group_coverage(regulations: list) -> dict:
+    """
+    Country heading -> sorted region names (without the flag or ', USA') for
+    the classified regulations' jurisdictions, in one pass.
+    """
+    groups = {}
+    for reg in regulations:
+        jur = reg['_jurisdiction']
+        if not jur:
+            continue
+        flag, _, name = jur.partition(' ')
+        country = _COUNTRIES.get(flag)
+        if country is None:
+            continue
+        regions = groups.setdefault(country, set())
+        if jur != country:
+            regions.add(name.replace(', USA', ''))
+    return {country: sorted(regions) for country, regions in groups.items()}
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _fetch_regulatory_coverage() -> dict:
+    """
+    Regulatory coverage, cached for 5 minutes as the loaded documents rarely
+    change. Each regulation is classified, and the jurisdictions grouped by
+    country under '_coverage', here once per fetch rather than on every rerun.
+    
+    Raises:
+        requests.exceptions.RequestException: If the backend call fails
+    """
+    data = _get_json("/regulatory_coverage")
+    regulations = [_classify_regulation(reg) for reg in data.get('regulations', [])]
+    return {**data, 'regulations': regulations, '_coverage': _group_coverage(regulations)}
+
 def regulatory_coverage_mode():
     """Display regulatory coverage and document information"""
     st.header("📚 Regulatory Coverage")
@@ -1464,91 +1391,40 @@ def regulatory_coverage_mode():
     """)
     
     if st.button("🔄 Refresh Coverage Data"):
+        _fetch_regulatory_coverage.clear()
         st.rerun()
     
     with st.spinner("Loading regulatory coverage information..."):
-        response = call_api("/regulatory_coverage")
-        if response and response.status_code == 200:
-            data = response.json()
+        data = _cached_call(_fetch_regulatory_coverage)
+        if data is not None:
             
             # Regulation details
             st.subheader("📋 Loaded Regulatory Documents")
             
             regulations = data.get('regulations', [])
             if regulations:
-                st.markdown('<div class="results-container">', unsafe_allow_html=True)
-                
-                # Jurisdiction mapping for better display
-                jurisdiction_map = {
-                    'ca': '🇨🇦 Canada',
-                    'eu': '🇪🇺 European Union', 
-                    'us': '🇺🇸 United States',
-                    'fl': '🇺🇸 Florida, USA',
-                    'ut': '🇺🇸 Utah, USA',
-                    'ccpa': '🇺🇸 California, USA',
-                    'coppa': '🇺🇸 United States (Federal)',
-                    'gdpr': '🇪🇺 European Union',
-                    'ncmec': '🇺🇸 United States (Federal)'
-                }
+                st.markdown(_RESULTS_OPEN, unsafe_allow_html=True)
                 
                 for reg in regulations:
-                    reg_name = reg.get('name', 'Unknown Regulation')
-                    filename = reg.get('filename', reg_name.lower().replace(' ', '_'))
-                    
-                    # Extract jurisdiction from filename
-                    jurisdiction = "🌍 Multi-jurisdictional"
-                    for prefix, jur in jurisdiction_map.items():
-                        if filename.lower().startswith(prefix) or prefix in filename.lower():
-                            jurisdiction = jur
-                            break
-                    
-                    # Determine regulation type
-                    reg_type = "📋 General Compliance"
-                    if any(keyword in reg_name.lower() for keyword in ['child', 'minor', 'kid', 'coppa']):
-                        reg_type = "👶 Child Protection"
-                    elif any(keyword in reg_name.lower() for keyword in ['data', 'privacy', 'gdpr', 'ccpa']):
-                        reg_type = "🔒 Data Privacy"
-                    elif any(keyword in reg_name.lower() for keyword in ['dsa', 'platform', 'social']):
-                        reg_type = "📱 Platform Regulation"
-                    elif any(keyword in reg_name.lower() for keyword in ['reporting', 'ncmec']):
-                        reg_type = "📊 Reporting Requirements"
-                        
-                    with st.expander(f"📜 {reg_name}"):
+                    content_length = reg.get('content_length', 0)
+                    with st.expander(f"📜 {reg['_name']}"):
                         col_a, col_b = st.columns(2)
                         with col_a:
-                            st.markdown(f"**📍 Jurisdiction:** {jurisdiction}")
-                            st.markdown(f"**📊 Content Length:** {reg.get('content_length', 0):,} characters")
-                            st.markdown(f"**📋 Type:** {reg_type}")
+                            st.markdown(
+                                f"**📍 Jurisdiction:** {reg['_jurisdiction'] or '🌍 Multi-jurisdictional'}\n\n"
+                                f"**📊 Content Length:** {content_length:,} characters\n\n"
+                                f"**📋 Type:** {reg['_type']}"
+                            )
                         with col_b:
                             # More descriptive status
-                            if reg.get('content_length', 0) > 0:
-                                status = "✅ Active & Indexed"
-                                status_color = "success"
-                            else:
-                                status = "⚠️ Loaded but Empty"
-                                status_color = "warning"
-                            
-                            st.markdown(f"**🔧 Status:** {status}")
-                            
-                            # Show content summary
-                            content_length = reg.get('content_length', 0)
-                            if content_length > 10000:
-                                size_desc = "📚 Comprehensive Document"
-                            elif content_length > 5000:
-                                size_desc = "📄 Standard Document"
-                            elif content_length > 1000:
-                                size_desc = "📃 Brief Document"
-                            else:
-                                size_desc = "📝 Summary Document"
-                            
-                            st.markdown(f"**📑 Size:** {size_desc}")
-                            
-                            # Calculate approximate reading time
-                            words = content_length // 5  # Rough estimate: 5 chars per word
-                            reading_time = max(1, words // 200)  # 200 words per minute
-                            st.markdown(f"**⏱️ Reading Time:** ~{reading_time} min")
+                            status = "✅ Active & Indexed" if content_length > 0 else "⚠️ Loaded but Empty"
+                            st.markdown(
+                                f"**🔧 Status:** {status}\n\n"
+                                f"**📑 Size:** {reg['_size']}\n\n"
+                                f"**⏱️ Reading Time:** ~{reg['_reading_time']} min"
+                            )
                 
-                st.markdown('</div>', unsafe_allow_html=True)
+                st.markdown(_RESULTS_CLOSE, unsafe_allow_html=True)
             else:
                 st.warning("⚠️ No regulatory documents found")
                 st.info("Check the /regulations directory for legal document files")
@@ -1556,65 +1432,15 @@ def regulatory_coverage_mode():
             # Jurisdictions covered - Enhanced display
             st.subheader("🌍 Geographic Coverage")
             if regulations:
-                # Extract unique jurisdictions from our enhanced mapping
-                jurisdiction_map = {
-                    'ca': '🇨🇦 Canada',
-                    'eu': '🇪🇺 European Union', 
-                    'us': '🇺🇸 United States',
-                    'fl': '🇺🇸 Florida, USA',
-                    'ut': '🇺🇸 Utah, USA',
-                    'ccpa': '🇺🇸 California, USA',
-                    'coppa': '🇺🇸 United States (Federal)',
-                    'gdpr': '🇪🇺 European Union',
-                    'ncmec': '🇺🇸 United States (Federal)'
-                }
+                # Jurisdictions grouped by country at fetch time
+                coverage = data['_coverage']
                 
-                detected_jurisdictions = set()
-                for reg in regulations:
-                    filename = reg.get('filename', reg.get('name', '').lower().replace(' ', '_'))
-                    for prefix, jur in jurisdiction_map.items():
-                        if filename.lower().startswith(prefix) or prefix in filename.lower():
-                            detected_jurisdictions.add(jur)
-                            break
-                
-                if detected_jurisdictions:
-                    # Group by country for better display
-                    countries = {}
-                    for jur in detected_jurisdictions:
-                        if '🇺🇸' in jur:
-                            countries.setdefault('🇺🇸 United States', []).append(jur)
-                        elif '🇪🇺' in jur:
-                            countries.setdefault('🇪🇺 European Union', []).append(jur)
-                        elif '🇨🇦' in jur:
-                            countries.setdefault('🇨🇦 Canada', []).append(jur)
-                    
-                    for country, regions in countries.items():
-                        unique_regions = list(set(regions))
-                        # Filter out the main country from the regions list
-                        specific_regions = [region for region in unique_regions if region != country]
-                        
-                        if len(specific_regions) == 0:
-                            # Only show the country if no specific regions
-                            st.success(f"{country}")
-                        else:
-                            # Show country with specific regions listed underneath
-                            st.success(f"{country}")
-                            for region in specific_regions:
-                                # Extract just the state/region name without country repetition
-                                if '🇺🇸' in region:
-                                    # For US states, extract just the state name
-                                    state_name = region.replace('🇺🇸 ', '').replace(', USA', '').replace(' (Federal)', ' (Federal)')
-                                    st.info(f"  • {state_name}")
-                                elif '🇪🇺' in region:
-                                    # For EU regions, extract region name
-                                    region_name = region.replace('🇪🇺 ', '')
-                                    st.info(f"  • {region_name}")
-                                elif '🇨🇦' in region:
-                                    # For Canadian regions, extract region name  
-                                    region_name = region.replace('🇨🇦 ', '')
-                                    st.info(f"  • {region_name}")
-                                else:
-                                    st.info(f"  • {region}")
+                if coverage:
+                    for country, regions in coverage.items():
+                        # Show each country with its specific regions listed underneath
+                        st.success(country)
+                        for region in regions:
+                            st.info(f"  • {region}")
                 else:
                     st.warning("⚠️ No jurisdiction information available")
             else:
@@ -1652,15 +1478,203 @@ def single_feature_mode():
             return
         
         with st.spinner("🔄 Analyzing feature for geo-compliance requirements..."):
-            response = call_api("/classify_enhanced", {
+            result = _post_api("/classify_enhanced", {
                 "title": title.strip(),
                 "description": description.strip()
             })
             
-            if response:
-                result = response.json()
+            if result is not None:
+                result['_analysis_timestamp'] = _utc_timestamp()
                 display_compliance_analysis(result, title, description)
 
+# Features sent per /classify_enhanced_batch request
+_BATCH_SIZE = 64
+# Upper bound on the read timeout of one batch request, however many items it carries
+_BATCH_READ_TIMEOUT_MAX = 300
+
+def _classify_batch(items: list):
+    """
+    Classify a chunk of {"title", "description"} items in one request.
+    
+    Returns:
+        Results in item order, with None for every item if the call failed;
+        None itself only when the backend has no batch endpoint (404/405),
+        so the caller can fall back per feature
+    """
+    if _backend_down():
+        return [None] * len(items)
+    try:
+        response = _session().post(
+            f"{API_BASE_URL}/classify_enhanced_batch", json={"items": items},
+            timeout=(API_TIMEOUT[0], min(API_TIMEOUT[1] * len(items), _BATCH_READ_TIMEOUT_MAX))
+        )
+        if response.status_code in (404, 405):
+            return None
+        response.raise_for_status()
+        return _json_loads(response.content)
+    except (requests.exceptions.RequestException, ValueError) as e:
+        if isinstance(e, requests.exceptions.Timeout):
+            # A hung backend would otherwise cost a full timeout per remaining chunk
+            _BREAKER["until"] = time.monotonic() + _BREAKER_COOLDOWN
+        _show_api_error(e)
+        return [None] * len(items)
+
+# Concurrent /classify_enhanced calls when a batch falls back per feature;
+# one per pooled connection of the shared session
+_FALLBACK_WORKERS = _POOL_MAXSIZE
+
+def _classify_each(items: list) -> list:
+    """
+    Classify items with one /classify_enhanced call each, overlapping the calls in threads.
+    
+    Returns:
+        Results in item order, with None where a call failed; the first
+        failure is rendered once the calls finish
+    """
+    if _backend_down():
+        return [None] * len(items)
+    
+    # Workers must not touch st.*, so errors are collected and shown afterwards
+    def classify(item):
+        response = _session().post(f"{API_BASE_URL}/classify_enhanced", json=item, timeout=API_TIMEOUT)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    with ThreadPoolExecutor(max_workers=_FALLBACK_WORKERS) as executor:
+        futures = [executor.submit(classify, item) for item in items]
+    
+    results, error = [], None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except (requests.exceptions.RequestException, ValueError) as e:
+            error = error or e
+            results.append(None)
+    if error is not None:
+        _show_api_error(error)
+    return results
+
+def _export_row(title: str, description: str, result) -> dict:
+    """Row of the batch results CSV for one feature; result is None if its API call failed"""
+    if result is None:
+        return {
+            'title': title,
+            'description': description,
+            'needs_geo_logic': 'error',
+            'overall_confidence': 0,
+            'primary_confidence': 0,
+            'secondary_confidence': 0,
+            'risk_assessment': 'error',
+            'reasoning': 'API Error - could not process',
+            'applicable_regulations': '',
+            'regulatory_requirements': '',
+            'recommended_actions': ''
+        }
+    return {
+        'title': title,
+        'description': description,
+        'needs_geo_logic': result.get('needs_geo_logic'),
+        'overall_confidence': result.get('overall_confidence', 0),
+        'primary_confidence': result.get('primary_confidence', 0),
+        'secondary_confidence': result.get('secondary_confidence', 0),
+        'risk_assessment': result.get('risk_assessment', 'unknown'),
+        'reasoning': result.get('reasoning', ''),
+        'applicable_regulations': str(result.get('applicable_regulations', [])),
+        'regulatory_requirements': str(result.get('regulatory_requirements', [])),
+        'recommended_actions': str(result.get('recommended_actions', []))
+    }
+
+# Features per page of the batch detailed analysis
+_DETAIL_PAGE_SIZE = 20
+
+def display_batch_results(output: dict, show_detailed: bool):
+    """Display a processed batch: download, summary, preview and paged detailed analysis"""
+    results = output['results']
+    detailed_results = output['detailed_results']
+    
+    if not results:
+        st.error("❌ No valid features could be processed")
+        return
+    
+    st.success(
+        f"✅ Batch processing completed! "
+        f"({output['unique']} unique features classified for {output['rows']} rows)"
+    )
+    
+    # Create results DataFrame
+    results_df = pd.DataFrame(results)
+    
+    # Provide download link, passing the encoded CSV straight to the button
+    st.download_button(
+        label="📥 Download Results CSV",
+        data=results_df.to_csv(index=False).encode("utf-8"),
+        file_name=output['file_name'],
+        mime="text/csv"
+    )
+    
+    # Summary statistics
+    st.subheader("📈 Summary Statistics")
+    col_a, col_b, col_c = st.columns(3)
+    
+    # Count results in one pass over the column
+    counts = results_df['needs_geo_logic'].value_counts(dropna=False)
+    compliant = int(counts.get(True, 0))
+    non_compliant = int(counts.get(False, 0))
+    uncertain = int(counts.get('uncertain', 0) + counts.get('error', 0))
+    
+    with col_a:
+        st.metric("🚨 Requires Compliance", compliant)
+    with col_b:
+        st.metric("✅ No Compliance Needed", non_compliant)
+    with col_c:
+        st.metric("❓ Uncertain/Error", uncertain)
+    
+    # Show results preview
+    st.subheader("📊 Results Preview")
+    st.dataframe(results_df[['title', 'needs_geo_logic', 'overall_confidence', 'risk_assessment']].head(10))
+    
+    # Show detailed analysis if requested
+    if show_detailed and detailed_results:
+        st.subheader(f"🔍 Detailed Analysis ({len(detailed_results)} features)")
+        
+        # For large numbers of features, show one page of expanders at a time
+        if len(detailed_results) > 10:
+            n_pages = math.ceil(len(detailed_results) / _DETAIL_PAGE_SIZE)
+            page = st.number_input("Page", min_value=1, max_value=n_pages, value=1, key="batch_detail_page") - 1
+            st.caption(f"Page {page + 1}/{n_pages}")
+            
+            start = page * _DETAIL_PAGE_SIZE
+            for idx, item in enumerate(detailed_results[start:start + _DETAIL_PAGE_SIZE], start=start + 1):
+                with st.expander(f"📋 Feature {idx}: {item['title']}", expanded=False):
+                    display_compliance_analysis(item['result'], item['title'], item['description'])
+        else:
+            # For smaller numbers, show directly with separators
+            for idx, item in enumerate(detailed_results):
+                st.markdown(f"---")
+                st.markdown(f"### Feature {idx + 1}: {item['title']}")
+                display_compliance_analysis(item['result'], item['title'], item['description'])
+
+@st.cache_resource(show_spinner=False)
+def _sample_csv():
+    """Sample batch upload as (DataFrame, encoded CSV), built once per process"""
+    sample_df = pd.DataFrame({
+        'title': [
+            'User Registration System',
+            'Content Recommendation Engine',
+            'Age Verification Gate',
+            'Anonymous Chat Feature',
+            'Location-Based Services'
+        ],
+        'description': [
+            'Allow users to create accounts with email verification and profile setup',
+            'AI system that recommends content based on user behavior and preferences',
+            'System to verify user age before allowing access to age-restricted content',
+            'Real-time messaging system that allows users to chat without revealing identity',
+            'Features that use GPS location to provide location-specific content and services'
+        ]
+    })
+    return sample_df, sample_df.to_csv(index=False).encode("utf-8")
+
 def batch_processing_mode():
     """Batch CSV processing interface"""
     st.header("📊 Batch CSV Processing")
@@ -1678,27 +1692,31 @@ def batch_processing_mode():
         )
         
         if uploaded_file:
-            # Preview uploaded data
-            df = pd.read_csv(uploaded_file)
-            st.subheader("📋 Data Preview")
-            st.dataframe(df.head())
-            
-            # Validate columns (accept multiple naming conventions)
+            # Validate columns from the header alone (accept multiple naming conventions)
             title_cols = ['title', 'feature_name', 'name']
             desc_cols = ['description', 'feature_description', 'desc']
             
-            has_title = any(col in df.columns for col in title_cols)
-            has_desc = any(col in df.columns for col in desc_cols)
+            header = pd.read_csv(uploaded_file, nrows=0).columns
+            title_col = next((col for col in title_cols if col in header), None)
+            desc_col = next((col for col in desc_cols if col in header), None)
             
-            if not has_title or not has_desc:
+            if title_col is None or desc_col is None:
                 missing = []
-                if not has_title:
+                if title_col is None:
                     missing.append("title/feature_name/name")
-                if not has_desc:
+                if desc_col is None:
                     missing.append("description/feature_description/desc")
                 st.error(f"❌ Missing required columns: {', '.join(missing)}")
                 return
             
+            # Parse only the two columns that are processed
+            uploaded_file.seek(0)
+            df = pd.read_csv(uploaded_file, usecols=[title_col, desc_col], **_CSV_OPTIONS)
+            
+            # Preview uploaded data
+            st.subheader("📋 Data Preview")
+            st.dataframe(df.head())
+            
             st.success(f"✅ Valid CSV with {len(df)} rows")
             
             # Processing options
@@ -1714,167 +1732,134 @@ def batch_processing_mode():
                     st.info(f"ℹ️ Detailed analysis will be shown for all {feature_count} features.")
             
             # Process button
-            if st.button("🚀 Process Batch", type="primary"):
-                # Get title and description column names
-                title_col = next((col for col in title_cols if col in df.columns), None)
-                desc_col = next((col for col in desc_cols if col in df.columns), None)
-                
+            # Output of an earlier run on the same file content, kept across reruns and mode switches
+            file_key = hashlib.sha1(uploaded_file.getvalue()).hexdigest()
+            output = st.session_state.get('batch_output')
+            if output and output['file'] != file_key:
+                output = None
+            
+            if st.button("🔁 Reprocess Batch" if output else "🚀 Process Batch", type="primary"):
                 with st.spinner(f"🔄 Processing {len(df)} features using enhanced analysis..."):
                     results = []
                     detailed_results = []
                     
-                    # Progress bar
+                    # Progress bar and count label
                     progress_bar = st.progress(0)
+                    progress_label = st.empty()
                     
-                    for idx, row in df.iterrows():
-                        # Update progress
-                        progress_bar.progress((idx + 1) / len(df))
-                        
-                        title = str(row[title_col]).strip()
-                        description = str(row[desc_col]).strip()
-                        
-                        if title and description and title.lower() != 'nan' and description.lower() != 'nan':
-                            # Use same logic as single feature analysis
-                            response = call_api("/classify_enhanced", {
-                                "title": title,
-                                "description": description
-                            })
-                            
-                            if response:
-                                result = response.json()
-                                
-                                # Store for CSV export
-                                results.append({
-                                    'title': title,
-                                    'description': description,
-                                    'needs_geo_logic': result.get('needs_geo_logic'),
-                                    'overall_confidence': result.get('overall_confidence', 0),
-                                    'primary_confidence': result.get('primary_confidence', 0),
-                                    'secondary_confidence': result.get('secondary_confidence', 0),
-                                    'risk_assessment': result.get('risk_assessment', 'unknown'),
-                                    'reasoning': result.get('reasoning', ''),
-                                    'applicable_regulations': str(result.get('applicable_regulations', [])),
-                                    'regulatory_requirements': str(result.get('regulatory_requirements', [])),
-                                    'recommended_actions': str(result.get('recommended_actions', []))
-                                })
-                                
-                                # Store detailed results for display
-                                if show_detailed:
-                                    detailed_results.append({
-                                        'title': title,
-                                        'description': description,
-                                        'result': result
-                                    })
-                            else:
-                                # Handle API error
-                                results.append({
-                                    'title': title,
-                                    'description': description,
-                                    'needs_geo_logic': 'error',
-                                    'overall_confidence': 0,
-                                    'primary_confidence': 0,
-                                    'secondary_confidence': 0,
-                                    'risk_assessment': 'error',
-                                    'reasoning': 'API Error - could not process',
-                                    'applicable_regulations': '',
-                                    'regulatory_requirements': '',
-                                    'recommended_actions': ''
-                                })
+                    # Valid features (non-empty, not 'nan'), selected with one vectorized mask
+                    titles = df[title_col].astype("string").fillna("").str.strip()
+                    descs = df[desc_col].astype("string").fillna("").str.strip()
+                    valid = (
+                        titles.ne("") & descs.ne("")
+                        & titles.str.lower().ne("nan") & descs.str.lower().ne("nan")
+                    ).to_numpy(dtype=bool)
+                    rows = list(zip(titles.to_numpy()[valid], descs.to_numpy()[valid]))
                     
-                    progress_bar.empty()
+                    # Classify each distinct (title, description) pair once, in chunks
+                    unique = list(dict.fromkeys(rows))
+                    classified = {}
                     
-                    if results:
-                        st.success("✅ Batch processing completed!")
-                        
-                        # Create results DataFrame
-                        results_df = pd.DataFrame(results)
-                        
-                        # Provide download link
-                        csv_buffer = io.StringIO()
-                        results_df.to_csv(csv_buffer, index=False)
-                        
-                        st.download_button(
-                            label="📥 Download Results CSV",
-                            data=csv_buffer.getvalue(),
-                            file_name=f"enhanced_classified_features_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                            mime="text/csv"
-                        )
+                    # At most ~100 progress updates reach the browser, however many chunks there are
+                    n_chunks = math.ceil(len(unique) / _BATCH_SIZE)
+                    progress_step = max(1, n_chunks // 100)
+                    for chunk_idx, start in enumerate(range(0, len(unique), _BATCH_SIZE)):
+                        chunk = unique[start:start + _BATCH_SIZE]
+                        items = [{"title": title, "description": description} for title, description in chunk]
+                        chunk_results = _classify_batch(items)
                         
-                        # Summary statistics
-                        st.subheader("📈 Summary Statistics")
-                        col_a, col_b, col_c = st.columns(3)
+                        if chunk_results is None:
+                            # Older backend without the batch endpoint: one call per feature
+                            chunk_results = _classify_each(items)
                         
-                        # Count results
-                        compliant = len(results_df[results_df['needs_geo_logic'] == True])
-                        non_compliant = len(results_df[results_df['needs_geo_logic'] == False])
-                        uncertain = len(results_df[results_df['needs_geo_logic'].isin(['uncertain', 'error'])])
+                        for key, result in zip(chunk, chunk_results):
+                            if result is not None:
+                                result['_analysis_timestamp'] = _utc_timestamp()
+                            classified[key] = result
                         
-                        with col_a:
-                            st.metric("🚨 Requires Compliance", compliant)
-                        with col_b:
-                            st.metric("✅ No Compliance Needed", non_compliant)
-                        with col_c:
-                            st.metric("❓ Uncertain/Error", uncertain)
+                        # Update progress
+                        if chunk_idx % progress_step == 0 or chunk_idx == n_chunks - 1:
+                            done = start + len(chunk)
+                            progress_bar.progress(done / len(unique))
+                            progress_label.text(f"Classified {done}/{len(unique)} unique features")
+                    
+                    # Fan the results back out in CSV order
+                    for title, description in rows:
+                        result = classified[(title, description)]
                         
-                        # Show results preview
-                        st.subheader("📊 Results Preview")
-                        st.dataframe(results_df[['title', 'needs_geo_logic', 'overall_confidence', 'risk_assessment']].head(10))
+                        # Store detailed results for display
+                        if result is not None:
+                            detailed_results.append({
+                                'title': title,
+                                'description': description,
+                                'result': result
+                            })
                         
-                        # Show detailed analysis if requested
-                        if show_detailed and detailed_results:
-                            st.subheader(f"🔍 Detailed Analysis ({len(detailed_results)} features)")
-                            
-                            # For large numbers of features, use expanders to keep interface manageable
-                            if len(detailed_results) > 10:
-                                for idx, item in enumerate(detailed_results):
-                                    with st.expander(f"📋 Feature {idx + 1}: {item['title']}", expanded=False):
-                                        display_compliance_analysis(item['result'], item['title'], item['description'])
-                            else:
-                                # For smaller numbers, show directly with separators
-                                for idx, item in enumerate(detailed_results):
-                                    st.markdown(f"---")
-                                    st.markdown(f"### Feature {idx + 1}: {item['title']}")
-                                    display_compliance_analysis(item['result'], item['title'], item['description'])
-                    else:
-                        st.error("❌ No valid features could be processed")
+                        # Store for CSV export
+                        results.append(_export_row(title, description, result))
+                    
+                    progress_bar.empty()
+                    progress_label.empty()
+                
+                # Keep the output across reruns, so downloading or paging through
+                # the detailed analysis doesn't lose or reprocess the batch
+                st.session_state.batch_output = {
+                    'file': file_key,
+                    'file_name': f"enhanced_classified_features_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    'results': results,
+                    'detailed_results': detailed_results,
+                    'unique': len(unique),
+                    'rows': len(rows),
+                }
+                st.session_state.pop("batch_detail_page", None)
+                output = st.session_state.batch_output
+            
+            if output:
+                display_batch_results(output, show_detailed)
     
     with col2:
         # Sample CSV download
         st.subheader("📄 Sample CSV Template")
         
-        sample_data = {
-            'title': [
-                'User Registration System',
-                'Content Recommendation Engine',
-                'Age Verification Gate',
-                'Anonymous Chat Feature',
-                'Location-Based Services'
-            ],
-            'description': [
-                'Allow users to create accounts with email verification and profile setup',
-                'AI system that recommends content based on user behavior and preferences',
-                'System to verify user age before allowing access to age-restricted content',
-                'Real-time messaging system that allows users to chat without revealing identity',
-                'Features that use GPS location to provide location-specific content and services'
-            ]
-        }
-        
-        sample_df = pd.DataFrame(sample_data)
+        sample_df, sample_csv = _sample_csv()
         
         # Show sample
         st.dataframe(sample_df)
         
         # Download sample
-        csv_buffer = io.StringIO()
-        sample_df.to_csv(csv_buffer, index=False)
-        
         st.download_button(
             label="📥 Download Sample CSV",
-            data=csv_buffer.getvalue(),
+            data=sample_csv,
             file_name="sample_features.csv",
             mime="text/csv"
         )
 
+_SETUP_INSTRUCTIONS = """
+**To run the backend:**
+```bash
+# Install dependencies
+pip install -r requirements.txt
+
+# Start FastAPI server
+uvicorn backend.main:app --reload
+```
+
+**To run this frontend:**
+```bash
+streamlit run frontend/app.py
+```
+"""
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_health() -> dict:
+    """
+    Backend health, cached for 30 seconds.
+    
+    Raises:
+        requests.exceptions.RequestException: If the backend call fails
+    """
+    return _get_json("/health")
+
 def api_status_mode():
     """API status and health check"""
     st.header("🔧 API Status")
@@ -1885,87 +1870,85 @@ def api_status_mode():
         st.subheader("Backend Health Check")
         
         if st.button("🔄 Check API Status"):
-            with st.spinner("Checking API status..."):
-                response = call_api("/health")
-                
-                if response:
-                    health_data = response.json()
-                    st.success("✅ Backend API is healthy!")
-                    st.json(health_data)
-                else:
-                    st.error("❌ Backend API is not responding")
+            _fetch_health.clear()
+        
+        with st.spinner("Checking API status..."):
+            health_data = _cached_call(_fetch_health)
+            
+            if health_data is not None:
+                st.success("✅ Backend API is healthy!")
+                st.json(health_data)
+            else:
+                st.error("❌ Backend API is not responding")
     
     with col2:
         st.subheader("Setup Instructions")
         
-        st.markdown("""
-        **To run the backend:**
-        ```bash
-        # Install dependencies
-        pip install -r requirements.txt
-        
-        # Start FastAPI server
-        uvicorn backend.main:app --reload
-        ```
-        
-        **To run this frontend:**
-        ```bash
-        streamlit run frontend/app.py
-        ```
-        """)
+        st.markdown(_SETUP_INSTRUCTIONS)
         
         st.info("💡 Make sure the backend is running on http://localhost:8000 before using the classification features.")
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_stats() -> dict:
+    """
+    Classification statistics, cached for 30 seconds.
+    
+    Raises:
+        requests.exceptions.RequestException: If the backend call fails
+    """
+    return _get_json("/stats")
+
 def statistics_mode():
     """Statistics and analytics interface"""
     st.header("📊 Classification Statistics")
     
     if st.button("🔄 Refresh Statistics"):
-        with st.spinner("Loading statistics..."):
-            response = call_api("/stats")
+        _fetch_stats.clear()
+    
+    with st.spinner("Loading statistics..."):
+        stats = _cached_call(_fetch_stats)
+        
+        if stats is not None:
             
-            if response:
-                stats = response.json()
-                
-                # Display key metrics
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    st.metric("Total Classifications", stats['total_classifications'])
-                
-                with col2:
-                    st.metric("Compliance Required", stats['compliance_required'])
-                
-                with col3:
-                    st.metric("No Compliance Needed", stats['no_compliance_needed'])
-                
-                with col4:
-                    st.metric("Average Confidence", f"{stats['average_confidence']:.1%}")
-                
-                # Risk level breakdown
-                st.subheader("📈 Risk Level Distribution")
-                risk_data = stats['risk_levels']
-                
-                col_a, col_b, col_c = st.columns(3)
-                with col_a:
-                    st.metric("🟢 Low Risk", risk_data['low'])
-                with col_b:
-                    st.metric("🟡 Medium Risk", risk_data['medium'])
-                with col_c:
-                    st.metric("🔴 High Risk", risk_data['high'])
-                
-                # Compliance rate
-                if stats['total_classifications'] > 0:
-                    compliance_rate = stats['compliance_required'] / stats['total_classifications']
-                    st.subheader("📊 Compliance Rate")
-                    st.progress(compliance_rate)
-                    st.write(f"**{compliance_rate:.1%}** of features require geo-compliance")
-                
-                # Show raw data
-                with st.expander("📋 Raw Statistics Data"):
-                    st.json(stats)
-            else:
-                st.error("❌ Failed to load statistics")
+            # Display key metrics
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                st.metric("Total Classifications", stats['total_classifications'])
+            
+            with col2:
+                st.metric("Compliance Required", stats['compliance_required'])
+            
+            with col3:
+                st.metric("No Compliance Needed", stats['no_compliance_needed'])
+            
+            with col4:
+                st.metric("Average Confidence", f"{stats['average_confidence']:.1%}")
+            
+            # Risk level breakdown
+            st.subheader("📈 Risk Level Distribution")
+            risk_data = stats['risk_levels']
+            
+            col_a, col_b, col_c = st.columns(3)
+            with col_a:
+                st.metric("🟢 Low Risk", risk_data['low'])
+            with col_b:
+                st.metric("🟡 Medium Risk", risk_data['medium'])
+            with col_c:
+                st.metric("🔴 High Risk", risk_data['high'])
+            
+            # Compliance rate
+            if stats['total_classifications'] > 0:
+                compliance_rate = stats['compliance_required'] / stats['total_classifications']
+                st.subheader("📊 Compliance Rate")
+                st.progress(compliance_rate)
+                st.write(f"**{compliance_rate:.1%}** of features require geo-compliance")
+            
+            # Show raw data
+            with st.expander("📋 Raw Statistics Data"):
+                st.json(stats)
+        else:
+            st.error("❌ Failed to load statistics")
 
 
 
@@ -1,13 +1,52 @@
 import pytest
+import asyncio
 import requests
 import json
+from httpx import AsyncClient
 from fastapi.testclient import TestClient
 from backend.main import app
 from backend.llm_classifier import LLMClassifier, LLMClassificationResult
 from backend.rag_loader import RegulationRAG
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 client = TestClient(app)
 
+def _post_json(path, obj, headers=None, http=client):
+    """POST obj as a JSON body, pre-serialized with orjson when it is installed"""
+    return http.post(path, content=_json_dumps(obj),
+                     headers={**(headers or {}), "content-type": "application/json"})
+
+@pytest.fixture(scope="session")
+def auth_headers():
+    """Log in once for the suite and return the bearer Authorization header"""
+    response = client.post("/token", data={
+        "username": "admin",
+        "password": "admin123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+@pytest.fixture(scope="session")
+def rag():
+    """One RegulationRAG for the suite, so regulations are loaded and indexed once"""
+    return RegulationRAG()
+
+@pytest.fixture(scope="session")
+def indexed_rag(rag):
+    """The shared RegulationRAG with its search index built once for the suite"""
+    rag.build_index()
+    return rag
+
+@pytest.fixture(scope="session")
+def classifier():
+    """One LLMClassifier for the suite"""
+    return LLMClassifier()
+
 class TestAuthentication:
     """Test authentication endpoints"""
     
@@ -32,7 +71,7 @@ class TestAuthentication:
     
     def test_protected_endpoint_without_token(self):
         """Test accessing protected endpoint without token"""
-        response = client.post("/classify", json={
+        response = _post_json("/classify", {
             "title": "Test Feature",
             "description": "Test description"
         })
@@ -41,19 +80,12 @@ class TestAuthentication:
 class TestClassification:
     """Test classification functionality"""
     
-    def test_single_classification_with_auth(self):
+    def test_single_classification_with_auth(self, auth_headers):
         """Test single feature classification with authentication"""
-        # First login
-        login_response = client.post("/token", data={
-            "username": "admin",
-            "password": "admin123"
-        })
-        token = login_response.json()["access_token"]
-        
         # Test classification
-        response = client.post("/classify", 
-            json={"title": "Age Verification System", "description": "System to verify user age"},
-            headers={"Authorization": f"Bearer {token}"}
+        response = _post_json("/classify",
+            {"title": "Age Verification System", "description": "System to verify user age"},
+            headers=auth_headers
         )
         assert response.status_code == 200
         data = response.json()
@@ -64,66 +96,54 @@ class TestClassification:
         assert "risk_level" in data
         assert "specific_requirements" in data
     
-    def test_classification_edge_cases(self):
+    def test_classification_edge_cases(self, auth_headers):
         """Test classification with edge cases"""
-        login_response = client.post("/token", data={
-            "username": "admin",
-            "password": "admin123"
-        })
-        token = login_response.json()["access_token"]
-        
         # Test with empty strings
-        response = client.post("/classify",
-            json={"title": "", "description": ""},
-            headers={"Authorization": f"Bearer {token}"}
+        response = _post_json("/classify",
+            {"title": "", "description": ""},
+            headers=auth_headers
         )
         assert response.status_code == 200
         
         # Test with very long text
         long_text = "x" * 1000
-        response = client.post("/classify",
-            json={"title": long_text, "description": long_text},
-            headers={"Authorization": f"Bearer {token}"}
+        response = _post_json("/classify",
+            {"title": long_text, "description": long_text},
+            headers=auth_headers
         )
         assert response.status_code == 200
 
 class TestRAGSystem:
     """Test RAG system functionality"""
     
-    def test_rag_initialization(self):
+    def test_rag_initialization(self, rag):
         """Test RAG system initialization"""
-        rag = RegulationRAG()
         assert rag is not None
         assert rag.regulations_dir == "regulations"
     
-    def test_regulation_loading(self):
+    def test_regulation_loading(self, rag):
         """Test regulation loading"""
-        rag = RegulationRAG()
         regulations = rag.load_regulations()
         assert len(regulations) > 0
         assert all("name" in reg for reg in regulations)
         assert all("content" in reg for reg in regulations)
     
-    def test_search_functionality(self):
+    def test_search_functionality(self, indexed_rag):
         """Test RAG search functionality"""
-        rag = RegulationRAG()
-        rag.build_index()
-        results = rag.search("age verification", k=3)
+        results = indexed_rag.search("age verification", k=3)
         assert len(results) > 0
         assert all("relevance_score" in result for result in results)
 
 class TestLLMClassifier:
     """Test LLM classifier functionality"""
     
-    def test_classifier_initialization(self):
+    def test_classifier_initialization(self, classifier):
         """Test LLM classifier initialization"""
-        classifier = LLMClassifier()
         assert classifier is not None
         assert classifier.model == "gpt-4o-mini"
     
-    def test_mock_classification(self):
+    def test_mock_classification(self, classifier):
         """Test mock classification fallback"""
-        classifier = LLMClassifier()
         result = classifier._mock_classification(
             "Age Verification System",
             "System to verify user age during registration"
@@ -151,30 +171,18 @@ class TestAPIEndpoints:
         assert "message" in data
         assert "version" in data
     
-    def test_regulations_endpoint(self):
+    def test_regulations_endpoint(self, auth_headers):
         """Test regulations endpoint"""
-        login_response = client.post("/token", data={
-            "username": "admin",
-            "password": "admin123"
-        })
-        token = login_response.json()["access_token"]
-        
-        response = client.get("/regulations", headers={"Authorization": f"Bearer {token}"})
+        response = client.get("/regulations", headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
         assert "regulations" in data
         assert "count" in data
         assert data["count"] > 0
     
-    def test_stats_endpoint(self):
+    def test_stats_endpoint(self, auth_headers):
         """Test statistics endpoint"""
-        login_response = client.post("/token", data={
-            "username": "admin",
-            "password": "admin123"
-        })
-        token = login_response.json()["access_token"]
-        
-        response = client.get("/stats", headers={"Authorization": f"Bearer {token}"})
+        response = client.get("/stats", headers=auth_headers)
         assert response.status_code == 200
         data = response.json()
         assert "total_classifications" in data
@@ -186,21 +194,22 @@ class TestAPIEndpoints:
 class TestRateLimiting:
     """Test rate limiting functionality"""
     
-    def test_rate_limiting(self):
+    def test_rate_limiting(self, auth_headers):
         """Test rate limiting (this would need more sophisticated testing in production)"""
         # This is a basic test - in production you'd want to test actual rate limiting
-        login_response = client.post("/token", data={
-            "username": "admin",
-            "password": "admin123"
-        })
-        token = login_response.json()["access_token"]
+        # Make multiple concurrent requests to test rate limiting
+        async def fire_requests():
+            async with AsyncClient(app=app, base_url="http://testserver") as async_client:
+                return await asyncio.gather(*(
+                    _post_json("/classify",
+                        {"title": f"Test Feature {i}", "description": "Test description"},
+                        headers=auth_headers,
+                        http=async_client
+                    )
+                    for i in range(5)
+                ))
         
-        # Make multiple requests to test rate limiting
-        for i in range(5):
-            response = client.post("/classify",
-                json={"title": f"Test Feature {i}", "description": "Test description"},
-                headers={"Authorization": f"Bearer {token}"}
-            )
+        for response in asyncio.run(fire_requests()):
             # Should succeed for reasonable number of requests
             assert response.status_code in [200, 429]
 
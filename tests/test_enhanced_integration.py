@@ -6,8 +6,85 @@ This demonstrates how the integrated system would work by testing
 the enhanced decision engine component directly.
 """
 
+import logging
+import os
+import sys
+import time
+from functools import lru_cache
+from types import MappingProxyType
+
 from backend.enhanced_decision_engine import EnhancedDecisionEngine
 
+@lru_cache(maxsize=1)
+def _engine() -> EnhancedDecisionEngine:
+    """Shared engine, so its threshold config is loaded once per process"""
+    return EnhancedDecisionEngine()
+
+@lru_cache(maxsize=1)
+def _summary() -> dict:
+    """Threshold summary of the shared engine; the config doesn't change at runtime"""
+    return _engine().get_threshold_summary()
+
+# Per-case detail goes through logging so quiet runs (LOGEO_QUIET=1, or pytest
+# without log capture at INFO) skip formatting it altogether
+log = logging.getLogger("logeo.demo")
+
+# Scored once before timing so first-call setup isn't counted as decision time
+_WARMUP_JOB = (
+    "warmup",
+    {"flag": "NoGeoLogic", "confidence": 0.5, "reasoning": "", "suggested_jurisdictions": [], "evidence_passage_ids": []},
+    [],
+    False
+)
+
+# Simulated output of your confidence system, built once at import; the
+# read-only mappings catch any accidental mutation by the engine
+_SCENARIOS = (
+    MappingProxyType({
+        "name": "High Confidence Legal Case",
+        "feature_text": "GDPR age verification for EU minors",
+        "llm_output": MappingProxyType({
+            "flag": "NeedsGeoLogic",
+            "confidence": 0.92,  # High confidence from your system
+            "reasoning": "Strong GDPR compliance signals detected",
+            "suggested_jurisdictions": ["European Union"],
+            "evidence_passage_ids": ["GDPR_Art8", "EU_DSA"]
+        }),
+        "rules_matched": ("age_detected", "regulatory_terminology")
+    }),
+    MappingProxyType({
+        "name": "Medium Confidence Safety Case",
+        "feature_text": "Parental controls for US minors",
+        "llm_output": MappingProxyType({
+            "flag": "NeedsGeoLogic", 
+            "confidence": 0.82,  # Below safety threshold
+            "reasoning": "Child protection mechanisms required",
+            "suggested_jurisdictions": ["United States"],
+            "evidence_passage_ids": ["COPPA", "NCMEC"]
+        }),
+        "rules_matched": ("age_detected", "child_protection")
+    }),
+    MappingProxyType({
+        "name": "Low Risk Business Case",
+        "feature_text": "A/B test button colors in Canada",
+        "llm_output": MappingProxyType({
+            "flag": "NoGeoLogic",
+            "confidence": 0.75,  # Above business threshold
+            "reasoning": "Standard business feature testing",
+            "suggested_jurisdictions": ["Canada"],
+            "evidence_passage_ids": []
+        }),
+        "rules_matched": ("location_detected",)
+    })
+)
+
+# Expected (final flag, review required, applicable threshold) per scenario
+_EXPECTED = MappingProxyType({
+    "High Confidence Legal Case": ("NeedsGeoLogic", False, 0.70),
+    "Medium Confidence Safety Case": ("Ambiguous", True, 0.85),
+    "Low Risk Business Case": ("NoGeoLogic", False, 0.70)
+})
+
 def test_enhanced_decision_integration():
     """Test enhanced decision engine to demonstrate integration concept"""
     
@@ -17,75 +94,54 @@ def test_enhanced_decision_integration():
     print()
     
     # Initialize the enhanced decision engine
-    engine = EnhancedDecisionEngine()
+    engine = _engine()
     
-    # Simulate what your confidence system would provide
-    test_scenarios = [
-        {
-            "name": "High Confidence Legal Case",
-            "feature_text": "GDPR age verification for EU minors",
-            "llm_output": {
-                "flag": "NeedsGeoLogic",
-                "confidence": 0.92,  # High confidence from your system
-                "reasoning": "Strong GDPR compliance signals detected",
-                "suggested_jurisdictions": ["European Union"],
-                "evidence_passage_ids": ["GDPR_Art8", "EU_DSA"]
-            },
-            "rules_matched": ["age_detected", "regulatory_terminology"]
-        },
-        {
-            "name": "Medium Confidence Safety Case",
-            "feature_text": "Parental controls for US minors",
-            "llm_output": {
-                "flag": "NeedsGeoLogic", 
-                "confidence": 0.82,  # Below safety threshold
-                "reasoning": "Child protection mechanisms required",
-                "suggested_jurisdictions": ["United States"],
-                "evidence_passage_ids": ["COPPA", "NCMEC"]
-            },
-            "rules_matched": ["age_detected", "child_protection"]
-        },
-        {
-            "name": "Low Risk Business Case",
-            "feature_text": "A/B test button colors in Canada",
-            "llm_output": {
-                "flag": "NoGeoLogic",
-                "confidence": 0.75,  # Above business threshold
-                "reasoning": "Standard business feature testing",
-                "suggested_jurisdictions": ["Canada"],
-                "evidence_passage_ids": []
-            },
-            "rules_matched": ["location_detected"]
-        }
+    # Inputs are built up front and the engine methods hoisted out of the loop
+    md = engine.make_decision
+    gat = engine.get_applicable_threshold
+    jobs = [
+        (scenario["feature_text"], scenario["llm_output"], list(scenario["rules_matched"]), False)
+        for scenario in _SCENARIOS
     ]
     
-    for scenario in test_scenarios:
-        print(f"📋 {scenario['name']}")
-        print("-" * 40)
-        
-        # This is where your confidence system would feed into the threshold system
-        decision = engine.make_decision(
-            feature_text=scenario["feature_text"],
-            llm_output=scenario["llm_output"],
-            rules_matched=scenario["rules_matched"],
-            rule_fired=False
-        )
+    # This is where your confidence system would feed into the threshold system
+    md(*_WARMUP_JOB)
+    t0 = time.perf_counter()
+    decisions = [md(*job) for job in jobs]
+    per_decision = (time.perf_counter() - t0) / len(jobs)
+    
+    # Checked on every run; only formatting the detail depends on the log level
+    verbose = log.isEnabledFor(logging.INFO)
+    for scenario, (feature_text, llm_output, _, _), decision in zip(_SCENARIOS, jobs, decisions):
+        threshold, _ = gat(decision.categories_detected)
+        threshold_met = decision.confidence >= threshold
         
-        print(f"Feature: {scenario['feature_text']}")
-        print(f"Your Confidence Score: {scenario['llm_output']['confidence']:.3f}")
-        print(f"Categories Detected: {decision.categories_detected}")
-        print(f"Applicable Threshold: {engine.get_applicable_threshold(decision.categories_detected)[0]:.2f}")
-        print(f"Threshold Met: {'✅' if decision.confidence >= engine.get_applicable_threshold(decision.categories_detected)[0] else '❌'}")
-        print(f"Final Decision: {decision.final_flag}")
-        print(f"Review Required: {decision.review_required}")
-        print(f"Escalation Rule: {decision.escalation_rule.value}")
-        print(f"Priority: {decision.review_priority}")
+        name = scenario["name"]
+        expected_flag, expected_review, expected_threshold = _EXPECTED[name]
+        assert decision.final_flag == expected_flag, name
+        assert decision.review_required == expected_review, name
+        assert threshold == expected_threshold, name
+        assert threshold_met != decision.review_required, name
+        assert bool(decision.threshold_violations) == decision.review_required, name
         
+        if not verbose:
+            continue
+        log.info(
+            "📋 %s\n%s\nFeature: %s\nYour Confidence Score: %.3f\n"
+            "Categories Detected: %s\nApplicable Threshold: %.2f\nThreshold Met: %s\n"
+            "Final Decision: %s\nReview Required: %s\nEscalation Rule: %s\nPriority: %s",
+            name, "-" * 40, feature_text, llm_output["confidence"],
+            decision.categories_detected, threshold,
+            "✅" if threshold_met else "❌",
+            decision.final_flag, decision.review_required,
+            decision.escalation_rule.value, decision.review_priority
+        )
         if decision.threshold_violations:
-            print(f"Violations: {decision.threshold_violations}")
-        
-        print()
+            log.info("Violations: %s", decision.threshold_violations)
+        log.info("")
     
+    print(f"⏱️  Average decision time: {per_decision * 1e6:.1f} µs over {len(jobs)} scenarios")
+    print()
     print("✅ INTEGRATION CONCEPT VERIFIED!")
     print()
     print("🔗 HOW THE INTEGRATION WORKS:")
@@ -96,9 +152,14 @@ def test_enhanced_decision_integration():
     print("5. Both systems provide complementary audit trails")
     print()
     print("📊 THRESHOLD SUMMARY:")
-    summary = engine.get_threshold_summary()
-    for category, info in summary.items():
+    for category, info in _summary().items():
         print(f"• {category}: {info['threshold']:.2f} → {info['escalation']}")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        # LOGEO_QUIET=1/true/yes hides the per-case detail; unset or 0 shows it
+        level=logging.WARNING if os.getenv("LOGEO_QUIET", "").lower() in ("1", "true", "yes") else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
     test_enhanced_decision_integration()
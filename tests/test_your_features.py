@@ -6,8 +6,79 @@ Input your feature descriptions and see how the system categorizes them
 and applies category-specific thresholds.
 """
 
+import argparse
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from backend.enhanced_decision_engine import EnhancedDecisionEngine
 
+# Per-case detail goes through logging so quiet runs (LOGEO_QUIET=1) skip
+# formatting it altogether
+log = logging.getLogger("logeo.demo")
+
+@lru_cache(maxsize=1)
+def _engine() -> EnhancedDecisionEngine:
+    """Shared engine, so its threshold config is loaded once per process"""
+    return EnhancedDecisionEngine()
+
+@lru_cache(maxsize=1)
+def _summary() -> dict:
+    """Threshold summary of the shared engine; the config doesn't change at runtime"""
+    return _engine().get_threshold_summary()
+
+@lru_cache(maxsize=None)
+def _display_name(category: str) -> str:
+    """Display form of a snake_case category name, e.g. 'legal_compliance' -> 'Legal Compliance'"""
+    return category.replace('_', ' ').title()
+
+@dataclass(frozen=True, slots=True)
+class PredefinedCase:
+    """A canned feature and the LLM output it is scored with"""
+    title: str
+    description: str
+    confidence: float
+    flag: str
+    rules: tuple = ()
+
+# Built once at import time so repeated runs don't rebuild the case literals
+_CASES = (
+    PredefinedCase(
+        title="High Risk - GDPR Compliance",
+        description="Age verification for EU users under 16 to comply with GDPR Article 8",
+        confidence=0.88,
+        flag="NeedsGeoLogic"
+    ),
+    PredefinedCase(
+        title="Medium Risk - Child Protection",
+        description="Parental controls for users under 13 in US markets",
+        confidence=0.82,
+        flag="NeedsGeoLogic",
+        rules=("child_protection",)
+    ),
+    PredefinedCase(
+        title="Low Risk - Business Analytics",
+        description="A/B test new UI design in Canada for user engagement",
+        confidence=0.75,
+        flag="NoGeoLogic"
+    ),
+    PredefinedCase(
+        title="Very Low Risk - Internal Tool",
+        description="Performance optimization for thumbnail caching",
+        confidence=0.65,
+        flag="NoGeoLogic"
+    ),
+)
+
 def test_custom_feature():
     """Test a custom feature with user input"""
     
@@ -21,22 +92,36 @@ def test_custom_feature():
     print("• 'VAT collection from EU sellers'")
     print()
     
-    # Get user input
-    title = input("Feature Title: ").strip()
-    description = input("Feature Description: ").strip()
-    
-    if not title or not description:
-        print("❌ Please provide both title and description")
-        return
-    
-    # Simulate LLM output (you can adjust these values)
-    print("\n🔧 Simulate LLM Output:")
-    confidence = float(input("LLM Confidence (0.0-1.0): ") or "0.75")
-    flag = input("LLM Flag (NeedsGeoLogic/NoGeoLogic/Ambiguous): ") or "Ambiguous"
-    
-    # Simulate rules matched
-    print("\n🔍 Rules Matched (comma-separated, or press Enter for none):")
-    rules_input = input("Rules: ").strip()
+    if sys.stdin.isatty():
+        # Get user input
+        title = input("Feature Title: ").strip()
+        description = input("Feature Description: ").strip()
+        
+        if not title or not description:
+            print("❌ Please provide both title and description")
+            return
+        
+        # Simulate LLM output (you can adjust these values)
+        print("\n🔧 Simulate LLM Output:")
+        confidence = float(input("LLM Confidence (0.0-1.0): ") or "0.75")
+        flag = input("LLM Flag (NeedsGeoLogic/NoGeoLogic/Ambiguous): ") or "Ambiguous"
+        
+        # Simulate rules matched
+        print("\n🔍 Rules Matched (comma-separated, or press Enter for none):")
+        rules_input = input("Rules: ").strip()
+    else:
+        # Piped input: title, description, confidence, flag and rules, one per line,
+        # read in one go without prompting; anything after is left for the menu
+        title, description, confidence_input, flag, rules_input = (
+            sys.stdin.readline().strip() for _ in range(5)
+        )
+        
+        if not title or not description:
+            print("❌ Please provide both title and description")
+            return
+        
+        confidence = float(confidence_input or "0.75")
+        flag = flag or "Ambiguous"
     rules_matched = [r.strip() for r in rules_input.split(",")] if rules_input else []
     
     # Create simulated LLM output
@@ -53,7 +138,7 @@ def test_custom_feature():
     print("🧠 ENHANCED DECISION ENGINE RESULTS")
     print("="*50)
     
-    engine = EnhancedDecisionEngine()
+    engine = _engine()
     
     result = engine.make_decision(
         feature_text=f"{title}: {description}",
@@ -98,71 +183,103 @@ def run_predefined_tests():
     print("🧪 PREDEFINED TEST CASES")
     print("=" * 50)
     
-    test_cases = [
-        {
-            "title": "High Risk - GDPR Compliance",
-            "description": "Age verification for EU users under 16 to comply with GDPR Article 8",
-            "confidence": 0.88,
-            "flag": "NeedsGeoLogic",
-            "rules": []
-        },
-        {
-            "title": "Medium Risk - Child Protection", 
-            "description": "Parental controls for users under 13 in US markets",
-            "confidence": 0.82,
-            "flag": "NeedsGeoLogic",
-            "rules": ["child_protection"]
-        },
-        {
-            "title": "Low Risk - Business Analytics",
-            "description": "A/B test new UI design in Canada for user engagement",
-            "confidence": 0.75,
-            "flag": "NoGeoLogic", 
-            "rules": []
-        },
-        {
-            "title": "Very Low Risk - Internal Tool",
-            "description": "Performance optimization for thumbnail caching",
-            "confidence": 0.65,
-            "flag": "NoGeoLogic",
-            "rules": []
-        }
+    engine = _engine()
+    # Inputs are built up front and the engine methods hoisted out of the loop
+    md = engine.make_decision
+    gat = engine.get_applicable_threshold
+    jobs = [
+        (
+            f"{case.title}: {case.description}",
+            {
+                "flag": case.flag,
+                "confidence": case.confidence,
+                "reasoning": f"Test case {i}",
+                "suggested_jurisdictions": [],
+                "evidence_passage_ids": []
+            },
+            list(case.rules),
+            len(case.rules) > 0
+        )
+        for i, case in enumerate(_CASES, 1)
     ]
     
-    engine = EnhancedDecisionEngine()
+    verbose = log.isEnabledFor(logging.INFO)
     
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n🧪 Test Case {i}: {test_case['title']}")
-        print("-" * 40)
-        
-        llm_output = {
-            "flag": test_case["flag"],
-            "confidence": test_case["confidence"],
-            "reasoning": f"Test case {i}",
-            "suggested_jurisdictions": [],
-            "evidence_passage_ids": []
-        }
+    for i, (case, job) in enumerate(zip(_CASES, jobs), 1):
+        result = md(*job)
+        if not verbose:
+            continue
         
-        result = engine.make_decision(
-            feature_text=f"{test_case['title']}: {test_case['description']}",
-            llm_output=llm_output,
-            rules_matched=test_case["rules"],
-            rule_fired=len(test_case["rules"]) > 0
+        log.info(
+            "\n🧪 Test Case %d: %s\n%s\nDescription: %s\nLLM Confidence: %.2f\nCategories: %s",
+            i, case.title, "-" * 40, case.description, case.confidence, result.categories_detected
         )
-        
-        print(f"Description: {test_case['description']}")
-        print(f"LLM Confidence: {test_case['confidence']:.2f}")
-        print(f"Categories: {result.categories_detected}")
         if result.categories_detected:
-            threshold, _ = engine.get_applicable_threshold(result.categories_detected)
-            print(f"Threshold: {threshold:.2f}")
-        print(f"Final Flag: {result.final_flag}")
-        print(f"Review Required: {result.review_required}")
-        print(f"Priority: {result.review_priority}")
+            threshold, _ = gat(result.categories_detected)
+            log.info("Threshold: %.2f", threshold)
+        log.info(
+            "Final Flag: %s\nReview Required: %s\nPriority: %s",
+            result.final_flag, result.review_required, result.review_priority
+        )
+
+def run_batch(path: str):
+    """Run every JSONL record in path ("-" for stdin) through the decision engine
+    
+    Each record needs feature_text and llm_output; rules_matched defaults to []
+    and rule_fired to whether any rules matched. One JSON line is printed per record.
+    """
+    md = _engine().make_decision
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        for line in stream:
+            if not line.strip():
+                continue
+            rec = _json_loads(line)
+            rules_matched = rec.get("rules_matched") or []
+            result = md(
+                rec["feature_text"],
+                rec["llm_output"],
+                rules_matched,
+                rec.get("rule_fired", len(rules_matched) > 0)
+            )
+            sys.stdout.write(json.dumps({
+                "feature_text": rec["feature_text"],
+                "final_flag": result.final_flag,
+                "confidence": result.confidence,
+                "categories_detected": result.categories_detected,
+                "review_required": result.review_required,
+                "review_priority": result.review_priority
+            }) + "\n")
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+def show_threshold_config():
+    """Print each category's threshold and escalation rule"""
+    print("\n📊 THRESHOLD CONFIGURATION:")
+    print("=" * 40)
+    for category, config in _summary().items():
+        print(f"• {_display_name(category)}: {config['threshold']:.2f} → {config['escalation']}")
+
+# Menu option -> handler; option 4 (exit) is handled by the loop itself
+_MENU_COMMANDS = {
+    "1": test_custom_feature,
+    "2": run_predefined_tests,
+    "3": show_threshold_config
+}
 
 def main():
     """Main menu for testing options"""
     
+    parser = argparse.ArgumentParser(description="Test features against the enhanced threshold system")
+    parser.add_argument("--batch", metavar="FEATURES_JSONL",
+                        help="score a JSONL file of features (\"-\" for stdin) instead of the interactive menu")
+    args = parser.parse_args()
+    
+    if args.batch:
+        run_batch(args.batch)
+        return
+    
     while True:
         print("\n🎯 ENHANCED THRESHOLD SYSTEM TESTING")
         print("=" * 50)
@@ -174,24 +291,22 @@ def main():
         
         choice = input("Choose an option (1-4): ").strip()
         
-        if choice == "1":
-            test_custom_feature()
-        elif choice == "2":
-            run_predefined_tests()
-        elif choice == "3":
-            engine = EnhancedDecisionEngine()
-            print("\n📊 THRESHOLD CONFIGURATION:")
-            print("=" * 40)
-            summary = engine.get_threshold_summary()
-            for category, config in summary.items():
-                print(f"• {category.replace('_', ' ').title()}: {config['threshold']:.2f} → {config['escalation']}")
-        elif choice == "4":
+        if choice == "4":
             print("👋 Goodbye!")
             break
-        else:
+        command = _MENU_COMMANDS.get(choice)
+        if command is None:
             print("❌ Invalid choice. Please select 1-4.")
+        else:
+            command()
         
         input("\nPress Enter to continue...")
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        # LOGEO_QUIET=1/true/yes hides the per-case detail; unset or 0 shows it
+        level=logging.WARNING if os.getenv("LOGEO_QUIET", "").lower() in ("1", "true", "yes") else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
     main() 
\ No newline at end of file